@@ -210,3 +210,14 @@ def test_json_str_as_first_arg():
 
     obj = JModel('{"my_field": "a-value"}')
     assert obj.my_field == 'a-value'
+
+
+def test_json_bytes_as_first_arg():
+    class JModel(JsonModel):
+        id: int
+
+    assert JModel(b'{"id": 1}').id == 1
+    assert JModel(bytearray(b'{"id": 2}')).id == 2
+
+    with pytest.raises(XModelError):
+        JModel(1)
@@ -4,6 +4,7 @@ from xmodel import BaseModel
 from xsentinels.null import Null
 import datetime as dt
 from decimal import Decimal
+import pytest
 
 
 class BasicModel(BaseModel):
@@ -56,3 +57,17 @@ def test_default_model_values_use_converters():
 
     b2 = B2Model()
     assert b2.f2 == Decimal('10.32')
+
+
+def test_date_converter_from_json():
+    field = BasicModel.api.structure.get_field('field_date')
+    converter = field.converter
+    model = BasicModel()
+    direction = Converter.Direction.from_json
+    assert converter(model.api, direction, field, '2021-03-04') == dt.date(2021, 3, 4)
+    assert converter(model.api, direction, field, '2021-3-4') == dt.date(2021, 3, 4)
+
+    # Other ISO 8601 date formats are not accepted.
+    for value in ('20210304', '2021-W09-4', '2021-063'):
+        with pytest.raises(ValueError):
+            converter(model.api, direction, field, value)
@@ -1,3 +1,6 @@
+import dataclasses
+import weakref
+
 from xsentinels import Nullable, Null
 
 from xmodel import Field, JsonModel
@@ -36,3 +39,26 @@ def test_lower_filter():
 
     obj.filtered_attr = Null
     assert obj.filtered_attr is Null
+
+
+@dataclasses.dataclass(eq=False)
+class ExtraField(Field):
+    extra: int = None
+
+
+def test_field_dataclass_subclass():
+    class MyModel(JsonModel):
+        an_int: int = ExtraField(extra=3)
+        a_str: str
+
+    obj = MyModel(an_int='1', a_str='a')
+    assert obj.an_int == 1
+    assert obj.api.json() == {'an_int': 1, 'a_str': 'a'}
+
+    field = MyModel.api.structure.get_field('an_int')
+    assert type(field) is ExtraField
+    assert field.extra == 3
+    assert field.type_hint is int
+
+    # Fields can still be weakly referenced.
+    assert weakref.ref(field)() is field
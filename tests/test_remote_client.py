@@ -1,3 +1,4 @@
+import gc
 from typing import Iterable, TypeVar
 
 from xsentinels import Default
@@ -6,6 +7,8 @@ from xurls.url import Query
 from xmodel import JsonModel
 from xmodel.common.types import FieldNames
 from xmodel.remote import RemoteClient, RemoteModel, RemoteApi
+from xmodel.remote.client import _ClientCacheDependency  # noqa - testing private dependency
+from xmodel.remote.weak_cache_pool import WeakCachePool
 
 M = TypeVar("M", bound=RemoteModel)
 
@@ -49,4 +52,151 @@ def test_related_remote_lookup_attempted():
     assert RChild.api.client.last_get_query == {'id': 20}
 
 
+class TQueriesClient(RemoteClient):
+    def __init__(self, api):
+        super().__init__(api)
+        self.queries = []
+
+    def get(
+        self,
+        query: Query = None,
+        *,
+        top: int = None,
+        fields: FieldNames = Default
+    ) -> Iterable[M]:
+        self.queries.append(query)
+        return [self.api.model_type({'id': _id}) for _id in query['id']]
+
+
+class TQueriesApi(RemoteApi[M]):
+    client: TQueriesClient
+
+
+class RChunked(RemoteModel, max_query_by_id=2):
+    api: TQueriesApi['RChunked']
+
+    id: int
+
+
+def test_get_via_id_splits_queries():
+    objs = list(RChunked.api.get_via_id([1, 2, 3, 4, 5]))
+
+    assert sorted(o.id for o in objs) == [1, 2, 3, 4, 5]
+    queries = RChunked.api.client.queries
+    assert [len(q['id']) for q in queries] == [2, 2, 1]
+    assert sorted(_id for q in queries for _id in q['id']) == [1, 2, 3, 4, 5]
+
+
+class RDeduped(RemoteModel, max_query_by_id=2):
+    api: TQueriesApi['RDeduped']
+
+    id: int
+
+
+def test_get_via_id_skips_duplicate_ids():
+    objs = list(RDeduped.api.get_via_id([1, 1, 2, 2, 3]))
+
+    assert sorted(o.id for o in objs) == [1, 2, 3]
+    assert RDeduped.api.client.queries == [{'id': [1, 2]}, {'id': [3]}]
+
+
+class RCached(RemoteModel):
+    api: TQueriesApi['RCached']
+
+    id: int
+
+
+@WeakCachePool(enable=True)
+def test_get_via_id_includes_cached_objects():
+    first = list(RCached.api.get_via_id([1, 2]))
+    objs = list(RCached.api.get_via_id([1, 2, 3]))
+
+    # Only `3` was not in the weak-cache, the others should be the same objects as before.
+    assert RCached.api.client.queries == [{'id': [1, 2]}, {'id': [3]}]
+    assert sorted(o.id for o in objs) == [1, 2, 3]
+    assert {id(o) for o in first} < {id(o) for o in objs}
+
+
+class TCommaIdsClient(TQueriesClient):
+    def get(
+        self,
+        query: Query = None,
+        *,
+        top: int = None,
+        fields: FieldNames = Default
+    ) -> Iterable[M]:
+        self.queries.append(query)
+        return [
+            self.api.model_type({'id': _id}) for ids in query['id'] for _id in ids.split(',')
+        ]
+
+
+class TCommaIdsApi(RemoteApi[M]):
+    client: TCommaIdsClient
+
+
+class RCommaIds(RemoteModel):
+    api: TCommaIdsApi['RCommaIds']
+
+    id: str
+
+
+@WeakCachePool(enable=True)
+def test_get_via_id_comma_separated_str_id_partly_cached():
+    first = list(RCommaIds.api.get_via_id(['1']))
+    objs = list(RCommaIds.api.get_via_id([' 1 ,2,3']))
+
+    # Only the parts of the id that were not cached should be queried for.
+    assert RCommaIds.api.client.queries == [{'id': ['1']}, {'id': ['2,3']}]
+    assert objs[0] is first[0]
+    assert sorted(o.id for o in objs) == ['1', '2', '3']
+
+
 # todo: Test `RemoteApi.option_all_for_name` and `RemoteApi.option_for_name` someday.
+
+
+def test_cache_set_max_size():
+    client = RChild.api.client
+    with _ClientCacheDependency() as cache_dependency:
+        cache_dependency.obj_cache_max_size = 2
+        client.cache_set('a', 1)
+        client.cache_set('b', 2)
+        client.cache_set('a', 3)
+        client.cache_set('c', 4)
+
+        # 'b' was set the longest time ago, since 'a' was set again after it.
+        assert cache_dependency.obj_cache == {'a': 3, 'c': 4}
+        assert client.cache_get('b') is None
+
+
+@WeakCachePool(enable=True)
+def test_weak_cache_forgets_deallocated_objects():
+    pool = WeakCachePool.grab()
+    obj = RChild(id=1)
+    pool.set('k', obj)
+    assert pool.get(RChild, 'k') is obj
+
+    # Setting a different object for the same key, the first object going away should not
+    # remove the newer one.
+    newer_obj = RChild(id=1)
+    pool.set('k', newer_obj)
+    del obj
+    gc.collect()
+    assert pool.get(RChild, 'k') is newer_obj
+
+    del newer_obj
+    gc.collect()
+    assert pool.get(RChild, 'k', 'default') == 'default'
+
+
+def test_cache_get_many_uses_single_item_methods():
+    class TOverrideClient(RemoteClient):
+        def cache_weak_get(self, key, default=None):
+            return f'weak-{key}'
+
+        def cache_get(self, key, default=None):
+            return f'strong-{key}'
+
+    client = TOverrideClient(api=RChild.api)
+    assert client.cache_weak_get_many(['a', 'b']) == ['weak-a', 'weak-b']
+    assert client.cache_get_many(['a', 'b']) == ['strong-a', 'strong-b']
@@ -186,5 +186,48 @@ def test_parent_model_no_id_then_embed_json_sub_model_fully():
     assert rp.api.json(only_include_changes=True) == json_data
 
 
+def test_related_field_resolves_to_id_field():
+    class RChild(RemoteModel):
+        pass
 
+    class JParent(JsonModel):
+        child: RChild
+        child_id: int
 
+    structure = JParent.api.structure
+    child_field = structure.get_field('child')
+    child_id_field = structure.get_field('child_id')
+
+    assert child_field.related_field is child_id_field
+    assert child_id_field.is_foreign_key
+    assert child_id_field.field_for_foreign_key_related_field is child_field
+
+
+class ReprChild(RemoteModel):
+    id: int
+    name: str = Field(include_in_repr=True)
+
+
+class ReprParent(RemoteModel):
+    id: int
+    name: str = Field(include_in_repr=True)
+    child: ReprChild = Field(include_in_repr=True)
+
+
+def test_repr_with_parenthesis_in_values():
+    obj = ReprParent(id=1, name='a (b)')
+    obj.child = ReprChild(id=2, name='c')
+
+    # Field order in the repr is not guaranteed, check each part of it.
+    child_repr = repr(obj.child)
+    assert child_repr.startswith('ReprChild(') and child_repr.endswith(')')
+    assert {'name=c', 'id=2'} == set(child_repr[len('ReprChild('):-1].split(', '))
+
+    obj_repr = repr(obj)
+    assert obj_repr.startswith('ReprParent(') and obj_repr.endswith(')')
+    assert 'name=a (b)' in obj_repr
+    assert f'child={child_repr}' in obj_repr
+    assert 'id=1' in obj_repr
+
+    obj.api.response_state.had_error = True
+    assert repr(obj) == f'{obj_repr[:-1]}, __had_error=True)'
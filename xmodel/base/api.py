@@ -710,12 +710,11 @@ class BaseApi(Generic[M]):
                     value=v
                 )
 
-            path = field_obj.json_path
-            if not path:
+            path_list = field_obj.json_path_keys
+            if not path_list:
                 set_value_into_json_dict(v, f)
                 continue
 
-            path_list = path.split(field_obj.json_path_separator)
             d = json
             for name in path_list[:-1]:
                 d = d.setdefault(name, {})
@@ -834,6 +833,13 @@ class BaseApi(Generic[M]):
         # is used at the same time.
         # It's something I would like to support in the future, but for now it's not needed.
         # We can assume that `field_obj.name == field_obj.json_path`
+        if not fields_to_pop:
+            return fields_to_pop
+
+        if field_objs is self.structure.fields:
+            # Normal case, use the subset the structure figured out ahead of time.
+            field_objs = self.structure.fields_with_include_with
+
         for field_obj in field_objs:
             if not field_obj.include_with_fields:
                 continue
@@ -964,10 +970,9 @@ class BaseApi(Generic[M]):
 
         values = {}
         for field_obj in fields:
-            path_list = field_obj.json_path.split(field_obj.json_path_separator)
             v = json
             got_value = True
-            for name in path_list:
+            for name in field_obj.json_path_keys:
                 if name not in v:
                     # We don't even have a 'None' value so we assume we just did not get the value
                     # from the api, and therefore we just skip doing anything with it.
@@ -1036,7 +1041,7 @@ class BaseApi(Generic[M]):
             # todo: at some point, allow customization of this via Field class
             #   Also, s tore the id
             f_id_name = f"{f}_id"
-            if typing_inspect.get_origin(field_obj.type_hint) is list:
+            if field_obj.type_hint_origin is list:
                 # todo: This code is not complete [Kaden never finished it up]
                 #   for now, just comment out.
 
@@ -1119,19 +1124,17 @@ class BaseApi(Generic[M]):
         of the associated model object. This is consulted when the BaseModel has __repr__
         called on it.
         """
-        names = set()
+        # Structure remembers which of its fields are `Field.include_in_repr`.
+        names = self.structure.repr_field_names()
         model = self.model
 
         # todo: Move this into pres-club override of list_of_attrs_to_repr in an BaseApi subclass.
-        if hasattr(model, 'account_id'):
-            names.add('account_id')
+        if 'account_id' not in names and hasattr(model, 'account_id'):
+            names = names | {'account_id'}
 
         # todo: Consider adding others here, perhaps all defined fields on model that have
         # todo: a non-None value?
 
-        for f in self.structure.fields:
-            if f.include_in_repr:
-                names.add(f.name)
         return list(names)
 
     def forget_original_json_state(self):
@@ -3,15 +3,19 @@
     it links back to the the overview doc for field objects at xmodel.__init__.py
 For more details see [Field Objects](../#field-objects)
 """
-from typing import TypeVar, Any, Type, Optional, TYPE_CHECKING, Dict, Set
+from typing import TypeVar, Any, Type, Optional, TYPE_CHECKING, Dict, Set, Tuple, Callable, \
+    FrozenSet, NamedTuple, Union
 
 from xmodel.common.unwrap import unwrap_optional_type
 from abc import ABC, abstractmethod
 from xsentinels.default import Default
+from xsentinels.null import Null
 import dataclasses
 from enum import Enum, auto as EnumAuto  # noqa
 from xmodel.errors import XModelError
 from copy import copy
+import sys
+import types
 import typing_inspect
 import inspect
 from xmodel.util import loop
@@ -19,9 +23,18 @@ from xmodel.util import loop
 if TYPE_CHECKING:
     from xmodel import BaseModel
     from xmodel import BaseApi
+    from xmodel.base.structure import BaseStructure
 
 T = TypeVar("T")
 
+_IMMUTABLE_TYPES = (
+    bool, int, float, str, bytes, frozenset, type(None), type, Enum,
+    types.FunctionType, types.BuiltinFunctionType
+)
+""" Option values of these types are shared as-is with child fields instead of being copied;
+    see `Field.resolve_defaults`.
+"""
+
 # We want these special methods in the documentation.
 __pdoc__ = {
     'Converter.__call__': True,
@@ -69,14 +82,16 @@ class Converter:
             field (str): Field information, this contains the name, types, etc...
             value (Any): The value that needs to be converted.
         """
+        # Direction members are singletons, so an identity check is all we need here
+        # (and avoids going though the slower `Enum` equality machinery).
         Direction = Converter.Direction  # noqa
-        if direction == Direction.to_json:
+        if direction is Direction.to_json:
             return self.to_json(api, field, value)
 
-        if direction == Direction.from_json:
+        if direction is Direction.from_json:
             return self.from_json(api, field, value)
 
-        if direction == Direction.to_model:
+        if direction is Direction.to_model:
             return self.to_model(api, field, value)
 
     # Instead of implementing `__call__`, you can implement of these instead if that's easier.
@@ -148,6 +163,34 @@ class LowerFilter(Filter):
         return value.lower()
 
 
+class SetattrPlan(NamedTuple):
+    """ Details about a `Field.type_hint`, see `Field.setattr_plan`. """
+
+    type_hint: Any
+    """ Type-hint to check value against (first type in a `Union`, otherwise
+        `Field.type_hint` its self).
+    """
+
+    accepted_types: Union[FrozenSet, tuple]
+    """ Set of the types a value can be without needing any conversion, ie: the
+        type-hint its self and all types in it if it's a `Union`
+        (a tuple instead if some type in it is not hashable).
+    """
+
+    container_type: Optional[type]
+    """ Container type (`list`/`set`) if type-hint is a `List[...]`/`Set[...]`,
+        otherwise None.
+    """
+
+    inside_type_hint: Any
+    """ The type inside the container; otherwise None. """
+
+    type_hint_origin: Any
+    """ Origin of the whole `Field.type_hint` (ie: `typing_inspect.get_origin`),
+        see `Field.type_hint_origin`.
+    """
+
+
 @dataclasses.dataclass(eq=False)
 class Field:
     """
@@ -209,6 +252,24 @@ class Field:
         """
         return option_name in self._options_explicitly_set_by_user
 
+    @classmethod
+    def _option_names(cls) -> Tuple[str, ...]:
+        """ Names of all the dataclass fields/options on `cls` that can be passed into
+            `__init__` (ie: not internal state like `Field.original_type_hint`),
+            in definition order.
+
+            `dataclasses.fields` rebuilds its result every time it's called;
+            since the options don't change after the class is defined we generate this once
+            per-class and cache it directly on that class (not inherited by subclasses).
+        """
+        names = cls.__dict__.get('_cached_option_names')
+        if names is None:
+            names = tuple(f.name for f in dataclasses.fields(cls) if f.init)
+            cls._cached_option_names = names
+        return names
+
+    _cached_option_names = None  # No type-hint means data-class ignores it.
+
     def resolve_defaults(
             self,
             *,  # Keyword args only after this point
@@ -264,6 +325,12 @@ class Field:
         # Using different var-name for self seems to be able to do that.
         _self = self
 
+        # This method runs for every field on every model class while they are constructed,
+        # bind the sentinel/builtins we use a lot to locals so they are fast lookups.
+        _Default = Default
+        _getattr = getattr
+        _setattr = setattr
+
         if parent_field:
             options_explicitly_set_by_user = parent_field._options_explicitly_set_by_user
         else:
@@ -273,10 +340,9 @@ class Field:
         # [ie: was not explicitly set by user].
         was_default_before_parent = set()
 
-        for data_field in dataclasses.fields(self):
-            data_field_name = data_field.name
-            child_value = getattr(self, data_field_name)
-            if child_value is Default:
+        for data_field_name in self._option_names():
+            child_value = _getattr(self, data_field_name)
+            if child_value is _Default:
                 was_default_before_parent.add(data_field_name)
             else:
                 options_explicitly_set_by_user.add(data_field_name)
@@ -296,21 +362,22 @@ class Field:
             #   3. The parent's value was set by the user (options_explicitly_set_by_user).
             #       - If the value was not set by user, we just leave us at `Default` and resolve
             #           them normally.
-            for parent_data_field in dataclasses.fields(parent_field):
-                p_attr_field: dataclasses.Field
-                data_field_name = parent_data_field.name
-                parent_value = getattr(parent_field, data_field_name)
-                child_value = getattr(self, data_field_name)
+            for data_field_name in parent_field._option_names():
+                parent_value = _getattr(parent_field, data_field_name)
+                child_value = _getattr(self, data_field_name)
 
-                if parent_value is Default:
+                if parent_value is _Default:
                     continue
 
                 if data_field_name not in options_explicitly_set_by_user:
                     continue
 
-                if child_value is Default:
+                if child_value is _Default:
                     # Child has Default and parent is not-Default, copy value onto child
-                    setattr(self, data_field_name, copy(parent_value))
+                    # (no need to copy immutable values, we can share them).
+                    if not isinstance(parent_value, _IMMUTABLE_TYPES):
+                        parent_value = copy(parent_value)
+                    _setattr(self, data_field_name, parent_value)
 
         # We always set the type-hint, Python will automatically surface the most recent
         # type-hint for us. We want to have it easily overridable without having to use a
@@ -318,15 +385,15 @@ class Field:
         _self.type_hint = type_hint
 
         # Resolve the special-case non-None Default's...
-        if self.name is Default:
+        if self.name is _Default:
             # todo: figure out if we should always set name...
             #   ...i'm inclined to not do that.
             _self.name = name
 
-        if self.json_path is Default:
+        if self.json_path is _Default:
             _self.json_path = self.name
 
-        if self.include_with_fields is Default:
+        if self.include_with_fields is _Default:
             _self.include_with_fields = set()
         else:
             # Ensure it's a set, not a list or some other thing the user provided.
@@ -340,16 +407,16 @@ class Field:
                 f"({self.include_with_fields})"
             )
 
-        if self.json_path_separator is Default:
+        if self.json_path_separator is _Default:
             _self.json_path_separator = '.'
 
-        if self.include_in_repr is Default:
+        if self.include_in_repr is _Default:
             _self.include_in_repr = False
 
-        if self.exclude is Default:
+        if self.exclude is _Default:
             _self.exclude = False
 
-        if self.read_only is Default:
+        if self.read_only is _Default:
             _self.read_only = False
 
         # If converter is None, but we do have a default one, use it...
@@ -357,26 +424,31 @@ class Field:
             default_converter_map and
             self.type_hint in default_converter_map and
             'converter' in was_default_before_parent and
-            self.converter in (None, Default)
+            self.converter in (None, _Default)
         ):
             _self.converter = default_converter_map.get(self.type_hint)
 
         if (
-            self.converter is Default and
+            self.converter is _Default and
             inspect.isclass(self.type_hint) and
             issubclass(self.type_hint, Enum)
         ):
             from xmodel.converters import EnumConverter
             _self.converter = EnumConverter()
 
-        if self.related_type is Default:
+        if self.related_type is _Default:
             # By Default, we look at type-hint to see if it had a related-type or not...
             type_hint = self.type_hint
             related_type = type_hint
-            if typing_inspect.get_origin(type_hint) is list:
+
+            # We only support Python >= 3.10, so we can look at the generic-alias attributes
+            # directly instead of going though `typing_inspect` (which has version-specific
+            # dispatching we don't need).
+            type_args = getattr(type_hint, '__args__', None)
+            if getattr(type_hint, '__origin__', None) is list and type_args:
                 # Check to see if related_type is from typing
                 # list and pull out first argument for List[]...
-                related_type = typing_inspect.get_args(type_hint)[0]
+                related_type = type_args[0]
 
             # Check if related type is a BaseModel or some other thing....
             from xmodel import BaseModel
@@ -386,12 +458,30 @@ class Field:
         # If we have a related type, and that related type has a usable id then we generate
         # a default related_field_name_for_id value if needed.
         if (
-            self.related_field_name_for_id is Default
+            self.related_field_name_for_id is _Default
             and self.related_type
             and self.related_type.api.structure.has_id_field()
         ):
             _self.related_field_name_for_id = f'{self.name}_id'
 
+        # These are used as dict keys (ie: structure field-maps and JSON keys),
+        # intern them so lookups with them can compare via identity and
+        # equal names are shared between all the fields that use them.
+        _intern = sys.intern
+        for key_name in ('name', 'json_path', 'related_field_name_for_id'):
+            key_value = _getattr(self, key_name)
+            if type(key_value) is str:
+                _setattr(self, key_name, _intern(key_value))
+
+        # Split the json_path up once, instead of every time we look for it in some JSON.
+        json_path = self.json_path
+        if json_path:
+            _self.json_path_keys = tuple(
+                _intern(k) for k in json_path.split(self.json_path_separator)
+            )
+        else:
+            _self.json_path_keys = ()
+
         # Always base-line this field to None, we set a value for this if needed
         # in `xmodel.base.structure.BaseStructure._generate_fields`.
         # Because we need to cross-examine fields to set this correctly...
@@ -399,6 +489,12 @@ class Field:
         # as part of the BaseModel class setup process.
         # See `field_for_foreign_key_related_field` doc-comment for more details.
         _self.field_for_foreign_key_related_field = None
+        _self.is_foreign_key = False
+
+        # Forget any previously resolved `Field.related_field` (and the structure it was
+        # found on), options it's based on may have just changed.
+        _self._related_field = _Default
+        _self._related_structure = _Default
 
     def resolve_remaining_defaults_to_none(self):
         """ Called by `xmodel.base.structure.BaseStructure` after it calls
@@ -411,12 +507,37 @@ class Field:
             before they get set to None by Default.
         """
         # Resolve all other fields still at Default to None
-        for attr_field in dataclasses.fields(self):
-            name = attr_field.name
+        _Default = Default
+        for name in self._option_names():
             child_value = getattr(self, name)
-            if child_value is Default:
+            if child_value is _Default:
                 setattr(self, name, None)
 
+        # Now that our options are final, see if our default can be used as-is.
+        self._resolve_static_default()
+
+    def _resolve_static_default(self):
+        """ Sets `Field.static_default` if `Field.default` is a constant value that can be
+            used as-is for a model's default value; ie: `None`, `Null` (when nullable) or an
+            immutable non-callable value that is already the type-hint's type.
+
+            Otherwise it's left as `Default` and the default value is figured out each time
+            it's needed (calling it, copying it, converting it, etc).
+        """
+        self.static_default = Default
+        default = self.default
+        if default is None or default is Default:
+            self.static_default = None
+        elif default is Null:
+            if self.nullable:
+                self.static_default = Null
+        elif (
+            not callable(default) and
+            isinstance(default, _IMMUTABLE_TYPES) and
+            (type(default) is self.type_hint or type(default) is self.type_hint_origin)
+        ):
+            self.static_default = default
+
     def __post_init__(self):
         # Ensure we unwrap the type-hint from any optional.
         type = self.type_hint
@@ -471,9 +592,70 @@ class Field:
         self.original_type_hint = value
         result = unwrap_optional_type(value, return_saw_null=True)
         self._type_hint = result[0]
+        self._setattr_plan = Default
+        self.static_default = Default
         if self.nullable is Default:
             self.nullable = bool(result[1])
 
+    _setattr_plan: Optional[SetattrPlan] = dataclasses.field(
+        init=False, default=Default, repr=False
+    )
+    """ Storage for `Field.setattr_plan`, reset when `Field.type_hint` is set. """
+
+    def setattr_plan(self) -> SetattrPlan:
+        """ Details about `Field.type_hint` that `xmodel.base.model.BaseModel.__setattr__`
+            needs each time a value is set on a model for us. They are figured out the first
+            time they are asked for and then remembered, so the model does not have to
+            inspect the type-hint for every value set.
+
+            See `SetattrPlan` for what's in it.
+        """
+        plan = self._setattr_plan
+        if plan is not Default:
+            return plan
+
+        type_hint = self.type_hint
+        type_hint_origin = typing_inspect.get_origin(type_hint)
+        union_sub_types = ()
+        if typing_inspect.is_union_type(type_hint):
+            # Field already unwrapped any Null/None types, so it's a Union only if there
+            # are other non-Null/None types in it. For right now lets only worry about the
+            # first one.
+            union_sub_types = typing_inspect.get_args(type_hint)
+            type_hint = union_sub_types[0]
+
+        container_type = None
+        inside_type_hint = None
+        origin = typing_inspect.get_origin(type_hint)
+        if origin in (list, set):
+            container_type = origin
+            inside_type_hint = typing_inspect.get_args(type_hint)[0]
+
+        accepted_types = (type_hint, *union_sub_types)
+        try:
+            accepted_types = frozenset(accepted_types)
+        except TypeError:
+            # Some type-hint is not hashable, use tuple as-is (`in` works the same with it).
+            pass
+
+        plan = SetattrPlan(
+            type_hint=type_hint,
+            accepted_types=accepted_types,
+            container_type=container_type,
+            inside_type_hint=inside_type_hint,
+            type_hint_origin=type_hint_origin,
+        )
+        self._setattr_plan = plan
+        return plan
+
+    @property
+    def type_hint_origin(self) -> Any:
+        """ Origin of `Field.type_hint` (ie: `list` for a `List[...]`, otherwise usually None),
+            the same as `typing_inspect.get_origin` would give; it's figured out once and then
+            remembered (see `Field.setattr_plan`).
+        """
+        return self.setattr_plan().type_hint_origin
+
     nullable: bool = Default
     """ (Default: Nullable in type-hint, ie: `some_var: Union[int, NullType]`; `False`)
 
@@ -516,6 +698,14 @@ class Field:
         set here for you automatically).
     """
 
+    static_default: Any = dataclasses.field(default=Default, init=False, repr=False)
+    """ If not `Default`, this is the value `Field.default` always resolves to for a model,
+        without needing to call/copy/convert it each time.
+
+        This is always set automatically after the field's options are resolved,
+        and should not be set manually.
+    """
+
     post_filter: Optional[Filter] = Default
     """ (Default: `Parent`, `None`)
 
@@ -554,8 +744,7 @@ class Field:
     #         f"property getter function. "
     #     )
 
-    @property
-    def getter(self):
+    def getter(self, func: 'Callable[[BaseModel], Any]') -> 'Field':
         """
         Like the built-in `@property` of python, except you can also place a Field and set
         any field-options you like, so it lets you make a field that will read/write to JSON
@@ -590,15 +779,10 @@ class Field:
         ...
         ...    _my_field_backing_store = None
         """
+        self.fget = func
+        return self
 
-        def set_setter_on_field_with(func):
-            self.fget = func
-            return self
-
-        return set_setter_on_field_with
-
-    @property
-    def setter(self):
+    def setter(self, func: 'Callable[[BaseModel, Any], None]') -> 'Field':
         """
         Used to easily set a `set_func` setter function on self via the standard
         property decorator syntax, ie:
@@ -613,12 +797,8 @@ class Field:
         ...        self._my_field_backing_store = value
 
         """
-
-        def set_setter_on_field_with(func):
-            self.fset = func
-            return self
-
-        return set_setter_on_field_with
+        self.fset = func
+        return self
 
     fget: 'Optional[Callable[[M], Any]]' = Default
     """ (Default: `Parent`; otherwise `None`)
@@ -691,6 +871,14 @@ class Field:
         Path separator to use in json_path.  Defaults to a period (".").
     """
 
+    json_path_keys: Tuple[str, ...] = dataclasses.field(default=(), init=False, repr=False)
+    """ `Field.json_path` split up via `Field.json_path_separator`, ie: the keys to follow
+        though nested JSON dicts to find our value.
+
+        This is always set automatically by `Field.resolve_defaults`,
+        and should not be set manually.
+    """
+
     # todo: Would like to rename this to just `repr`, just like in dataclasses.
     include_in_repr: bool = Default
     """ (Default: `Parent`, `False`)
@@ -800,21 +988,23 @@ class Field:
     it's `_generate_fields` method.
     """
 
-    @property
-    def is_foreign_key(self):
-        """
-            .. important:: Not currently used, will be used when one-to-many support is fully
-                added. However, this should still be populated and return correct information.
+    is_foreign_key: bool = dataclasses.field(default=False, init=False, repr=False)
+    """
+        .. important:: Not currently used, will be used when one-to-many support is fully
+            added. However, this should still be populated and return correct information.
 
-            If we have a `field_for_foreign_key_related_field`, then we are a foreign key field.
+        If we have a `field_for_foreign_key_related_field`, then we are a foreign key field.
 
-            This checks `Field.field_for_foreign_key_related_field` and returns True or False
-            depending on if that has a field value or not.
+        This is True or False depending on if `Field.field_for_foreign_key_related_field`
+        has a field value or not. Like that attribute, it's always set automatically by
+        `xmodel.base.structure.BaseStructure` when it generates its fields, and should not be
+        set manually. `BaseStructure._generate_fields` (and the `Field.resolve_defaults` it
+        calls) is the only writer of both, and always sets them together; setting one of them
+        anywhere else would leave them out of sync.
 
-            This property just makes it clear and documents on how one knows if we are a
-            foreign key field or not.
-        """
-        return bool(self.field_for_foreign_key_related_field)
+        This attribute just makes it clear and documents on how one knows if we are a
+        foreign key field or not.
+    """
 
     related_to_many: bool = Default
     """
@@ -838,7 +1028,33 @@ class Field:
 
     @property
     def related_field(self) -> 'Field':
-        """ Set to the Field for the `Field.related_field_name_for_id`. """
-        api = self.related_type.api if self.related_to_many else self.model.api
-        return api.structure.get_field(self.related_field_name_for_id)
+        """ Set to the Field for the `Field.related_field_name_for_id`.
+
+            Resolved the first time it's asked for and then remembered;
+            `Field.resolve_defaults` forgets any remembered value.
+        """
+        related_field = self._related_field
+        if related_field is Default:
+            structure = self._related_structure
+            if structure is Default:
+                api = self.related_type.api if self.related_to_many else self.model.api
+                structure = api.structure
+            related_field = structure.get_field(self.related_field_name_for_id)
+            self._related_field = related_field
+        return related_field
+
+    _related_field: 'Optional[Field]' = dataclasses.field(
+        init=False, default=Default, repr=False
+    )
+    """ Storage for the `Field.related_field` property. """
+
+    _related_structure: 'Optional[BaseStructure]' = dataclasses.field(
+        init=False, default=Default, repr=False
+    )
+    """ Structure that `Field.related_field` is looked up on, set by
+        `xmodel.base.structure.BaseStructure` when it generates its fields
+        (the related type's structure for `Field.related_to_many`, otherwise the owning one).
+        If left at `Default`, we find it via the `api` of the related/owning model.
+    """
+
 
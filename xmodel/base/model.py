@@ -8,7 +8,6 @@ from typing import get_type_hints, TYPE_CHECKING, TypeVar, Generic, Type, Option
     Callable
 from abc import ABC
 import inspect
-import typing_inspect
 from xmodel.common.types import JsonDict
 
 from xsentinels.null import Null, NullType
@@ -33,10 +32,10 @@ log = getLogger(__name__)
 M = TypeVar('M')
 
 basic_type_hints_map = {
-    int: lambda x: int(x),
-    str: lambda x: str(x),
-    bool: lambda x: bool(x),
-    float: lambda x: float(x)
+    int: int,
+    str: str,
+    bool: bool,
+    float: float
 }
 
 __pdoc__ = {
@@ -235,10 +234,12 @@ class BaseModel(ABC):
             if lazy_loader:
                 lazy_loader(cls)
 
-            for parent in cls.mro():
-                if parent is not cls and issubclass(parent, BaseModel):
+            for parent in cls.__bases__:
+                if issubclass(parent, BaseModel):
                     # Ensure that parent-class has a chance to lazy-load it's self
                     # before we try to examine our type-hints.
+                    # Only need our direct bases, their lazy-load does the same for their own
+                    # parents; and once a class is loaded `api` is a plain attribute on it.
                     getattr(parent, 'api')
 
             # We potentially get called a lot (for every sub-class)
@@ -333,6 +334,9 @@ class BaseModel(ABC):
                 If raw dictionary parsed from JSON string. It just calls
                 `self.api.update_from_json(args[0])` for you.
 
+                ## FirstArg - If str/bytes:
+                A JSON string, we parse it and then use the resulting dict like above.
+
                 ## FirstArt - If BaseModel:
                 If a `BaseModel`, will copy fields over that have the same name.
                 You can use this to duplicate a Model object, if you want to copy it.
@@ -346,8 +350,7 @@ class BaseModel(ABC):
                 They will be set into the object the same way you would normally doing it:
                 ie: `model_obj.some_attr = v` is the same as `ModelClass(some_attr=v)`.
         """
-        args_len = len(args)
-        if args_len > 1:
+        if len(args) > 1:
             raise NotImplementedError(
                 "Passing XContext via second positional argument is no longer supported."
             )
@@ -356,10 +359,17 @@ class BaseModel(ABC):
         api = cls_api_type(model=self)
         setattr(self, "api", api)  # Avoids IDE from using this as type-hint for `self.api`.
 
-        first_arg = args[0] if args_len > 0 else None
+        # Most of the time there is no first argument, skip checking its type if so.
+        first_arg = args[0] if args else None
 
-        if isinstance(first_arg, str):
-            # We assume `str` is a json-string, parse json and import.
+        if first_arg is None:
+            pass
+        elif type(first_arg) is dict:
+            # Most common case, a plain dict parsed from JSON; check for it before using the
+            # slower abstract `Mapping` isinstance check below.
+            api.update_from_json(first_arg)
+        elif isinstance(first_arg, (str, bytes, bytearray)):
+            # We assume `str`/`bytes` is a json-string, parse json and import.
             json_objs = json.loads(first_arg)
             api.update_from_json(json_objs)
         elif isinstance(first_arg, BaseModel):
@@ -367,22 +377,27 @@ class BaseModel(ABC):
             api.copy_from_model(first_arg)
         elif isinstance(first_arg, Mapping):
             api.update_from_json(first_arg)
-        elif first_arg is not None:
+        else:
             raise XModelError(
                 f"When a first argument to BaseModel.__init__ is provided, it needs to be a "
                 f"mapping/dict with the json values in it "
                 f"OR a BaseModel instance to copy from "
-                f"OR a str with a json dict/obj to parse inside of string; "
+                f"OR a str/bytes with a json dict/obj to parse inside of string; "
                 f"I was given a type ({type(first_arg)}) with value ({first_arg}) instead."
             )
 
-        for k, v in initial_values.items():
-            if not self.api.structure.get_field(k):
-                raise XModelError(
-                    f"While constructing {self}, init method got a value for an "
-                    f"unknown field ({k})."
-                )
+        if not initial_values:
+            return
 
+        # Check all the names at once, before we set anything.
+        unknown = initial_values.keys() - api.structure.field_map.keys()
+        if unknown:
+            raise XModelError(
+                f"While constructing {self}, init method got a value for an "
+                f"unknown field ({', '.join(sorted(unknown))})."
+            )
+
+        for k, v in initial_values.items():
             setattr(self, k, v)
 
     def __repr__(self):
@@ -399,35 +414,26 @@ class BaseModel(ABC):
         # DO NOT use hasattr() in here, because you could make every lazily loaded object load up
         # [ie: an API request to grab lazily loaded object properties] when the lazy object is set.
 
+        if name == "api" or name[:1] == "_":
+            # Don't do anything special with the 'api' var or private vars; check them first so
+            # we don't touch the api/structure at all for them.
+            super().__setattr__(name, value)
+            return
+
         api = self.api
         structure = api.structure
         field = structure.get_field(name)
         type_hint = None
 
-        # By default, we go through the special set/converter logic.
-        do_default_attr_set = False
-
-        if inspect.isclass(self):
-            # If we are a class, just pass it along
-            do_default_attr_set = True
-        elif name == "api":
-            # Don't do anything special with the 'api' var.
-            do_default_attr_set = True
-        elif name.startswith("_"):
-            # don't do anything with private vars
-            do_default_attr_set = True
-        elif name.endswith("_id") and structure.is_field_a_child(name[:-3], and_has_id=True):
+        # Setting attributes on a model class goes though its metaclass, not here;
+        # so `self` is always a model instance.
+
+        if name in structure.related_id_field_names():
             # We have a virtual field for a related field id, redirect to special setter.
             state = _private.api.get_api_state(api)
             state.set_related_field_id(name[:-3], value)
             return
 
-        if do_default_attr_set:
-            # We don't do anything more if it's a special attribute/field/etc.
-            super().__setattr__(name, value)
-            return
-
-        field = structure.get_field(name)
         if not field:
             # We don't do anything more without a field object
             # (ie: just a normal python attribute of some sort, not tied with API).
@@ -438,24 +444,19 @@ class BaseModel(ABC):
             # We have a value going to an attributed that has a type-hint, checking the type...
             # We will also support auto-converting to correct type if needed and possible,
             # otherwise an error will be thrown if we can't verify type or auto-convert it.
-            type_hint = field.type_hint
             value_type = type(value)
 
-            # todo: idea: We could cache some of these details [perhaps even using closures]
-            #       or use dict/set's someday for a speed improvement, if we ever need to.
-
-            hint_union_sub_types = ()
-            if typing_inspect.is_union_type(type_hint):
-                # Gets all args in a union type, to see if one of them will match type_hint.
-                hint_union_sub_types = typing_inspect.get_args(type_hint)
-                # Get first type hint in untion, Field object (where we just got type-hint)
-                # already unwraps the type hint, removing any Null/None types. It's a Union
-                # only if there are other non-Null/None types in a union. For right now
-                # lets only worry about the first one.
-                type_hint = hint_union_sub_types[0]
+            # Field inspects its type-hint once and remembers the details we need here;
+            # for a union `type_hint` is the first type in it (see `Field.setattr_plan`).
+            type_hint, accepted_types, container_type, inside_type_hint, _ = (
+                field.setattr_plan()
+            )
 
-            state = _private.api.get_api_state(api)
-            if (
+            if value_type is type_hint and value is not None:
+                # Most common case, type is exactly the type-hint; check it first so we skip
+                # everything else. See the more general check for this further below.
+                _private.api.get_api_state(api).reset_related_field_id_if_exists(name)
+            elif (
                 # If we have a blank string, but field is not of type str,
                 # and field is also nullable; we then we convert the value into a Null.
                 # (ie: user is setting a blank-string on a non-string field)
@@ -467,17 +468,19 @@ class BaseModel(ABC):
                 value = Null
             elif value is None:
                 # By default, this is None [unless user specified something].
-                value = _get_default_value_from_field(self, field)
+                value = field.static_default
+                if value is Default:
+                    value = _get_default_value_from_field(self, field)
             elif (
-                value_type is type_hint
-                or value_type in hint_union_sub_types
-                or Optional[value_type] is type_hint
+                # Field already unwrapped any Optional/None from the type-hint, so we only need
+                # to check the type-hint and its union types (all in `accepted_types`).
+                value_type in accepted_types
                 or type_hint is NullType and field.nullable
             ):
                 # Type is the same as type hint, no need to do anything else.
                 # We check to reset any related field id info, just in case it exists,
                 # since this field is either being set to Null or an actual object.
-                state.reset_related_field_id_if_exists(name)
+                _private.api.get_api_state(api).reset_related_field_id_if_exists(name)
                 pass
             elif value is Null:
                 # If type_hint supported the Null type, then it would have been dealt with in
@@ -508,9 +511,8 @@ class BaseModel(ABC):
                     f"to do this, then don't put a type-hint on the attribute."
                 )
                 value = {}
-            elif typing_inspect.get_origin(type_hint) in (list, set):
+            elif container_type is not None:
                 # See if we have a converter for this type in our default-converters....
-                inside_type_hint = typing_inspect.get_args(type_hint)[0]
                 basic_type_converter = self.api.default_converters.get(inside_type_hint)
                 if basic_type_converter:
                     converted_values = [
@@ -522,7 +524,6 @@ class BaseModel(ABC):
                         ) for x in loop(value)
                     ]
 
-                    container_type = typing_inspect.get_origin(type_hint)
                     value = container_type(converted_values)
                 # Else/Otherwise we just leave things as-is for now, no error and no conversion
                 pass
@@ -562,8 +563,9 @@ class BaseModel(ABC):
         if field.post_filter:
             value = field.post_filter(api=api, name=name, value=value)
 
-        if field.fset:
-            field.fset(self, value)
+        fset = field.fset
+        if fset:
+            fset(self, value)
         elif field.fget:
             raise XModelError(
                 f"We have a field ({field}) that does not have a Field.fset (setter function),"
@@ -577,14 +579,13 @@ class BaseModel(ABC):
 
     def __getattr__(self, name: str):
         # Reminder: This method only gets called if attribute is not currently defined in self.
-        structure = self.api.structure
-        state = _private.api.get_api_state(self.api)
-
-        field = structure.get_field(name)
-
         if name.startswith("_"):
             return object.__getattribute__(self, name)
 
+        api = self.api
+        structure = api.structure
+        field = structure.get_field(name)
+
         if field and field.fget:
             # Use getter to get value, if we get a non-None value return it.
             # If we get a None back, then do the default thing we normally do
@@ -593,10 +594,10 @@ class BaseModel(ABC):
             if value is not None:
                 return value
 
-        if name.endswith("_id") and structure.is_field_a_child(name[:-3], and_has_id=True):
+        if name in structure.related_id_field_names():
             # We have a field that ends with _id, that when taken off is a child field that
             # uses and id. This means we should treat this field as virtually related field id.
-            value = state.get_related_field_id(name[:-3])
+            value = _private.api.get_api_state(api).get_related_field_id(name[:-3])
             if value is not None:
                 if field and field.fset:
                     field.fset(self, value)
@@ -612,7 +613,7 @@ class BaseModel(ABC):
             field.related_type is not None and
             field.related_type.api.structure.has_id_field()
         ):
-            name_id_value = state.get_related_field_id(name)
+            name_id_value = _private.api.get_api_state(api).get_related_field_id(name)
 
             # RemoteModel is an abstract interface,
             # Let's us know how to lazily lookup remote objects by their id value.
@@ -638,7 +639,9 @@ class BaseModel(ABC):
                 # Otherwise, we continue, next thing to do is look for any default value.
 
         # We next look for a default value, if any set/return that.
-        default = _get_default_value_from_field(self, field)
+        default = field.static_default
+        if default is Default:
+            default = _get_default_value_from_field(self, field)
 
         # We set to default value and return it if we have a non-None value.
         if default is not None:
@@ -683,24 +686,26 @@ if 'Self' not in globals():
 
 
 def _get_default_value_from_field(model: BaseModel, field: Field = None) -> Any:
-    if not field or field.default is None:
+    # Callers normally check `Field.static_default` first, which already handles
+    # the constant defaults; so the sentinel checks here are all simple identity checks.
+    if field is None:
         return None
 
     default = field.default
+    if default is None or default is Default:
+        return None
 
     if default is Null:
         if not field.nullable:
             raise XModelError(f"Default for field {field} is Null but field is not Nullable.")
         return Null
 
-    if default is Default:
-        return None
-
     # If it's callable, we call it;
     # It could be a list or a dict type or a generator function of some sort.
+    # (classes are callable, so anything past this point is not a class).
     if callable(default):
         default = default()
-    elif not inspect.isclass(default) and isinstance(default, BaseModel):
+    elif isinstance(default, BaseModel):
         # We should make a copy of the object, as using the same instance 'default' across multiple
         # instances is almost certainly not what the user wants.
         # if the user truly wants to share the same exact default BaseModel instance across multiple
@@ -719,7 +724,7 @@ def _get_default_value_from_field(model: BaseModel, field: Field = None) -> Any:
 
     default_type = type(default)
     type_hint = field.type_hint
-    if default_type is not type_hint and default_type is not typing_inspect.get_origin(type_hint):
+    if default_type is not type_hint and default_type is not field.type_hint_origin:
         if not field.converter:
             raise XModelError(
                 f"Default for field ({field.name}) for model_type ({type(model)}) is of type "
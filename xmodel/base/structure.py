@@ -6,22 +6,82 @@ of a `xmodel.base.model.BaseModel.api`.
 from xmodel.common.types import JsonDict
 from xmodel.errors import XModelError
 from xmodel.base.fields import Field
+from xmodel.common.lazy import LazyAttr  # noqa - orm private module
 from xsentinels.default import Default
-from typing import TypeVar, Optional, Dict, List, Type, Any, Generic
+from typing import TypeVar, Optional, Dict, List, Type, Any, Generic, FrozenSet, \
+    Sequence, Tuple
 from typing import TYPE_CHECKING
-import typing_inspect
 import inspect
 from types import MappingProxyType
 from typing import Mapping
+import dataclasses
+import weakref
 
 F = TypeVar("F", bound=Field)
 
-supported_basic_types = {str, int, JsonDict, bool, float, list, dict}
+
+def _lazy_attr_names(cls: type) -> Tuple[str, ...]:
+    """ Names of all the `xmodel.common.lazy.LazyAttr`'s on `cls` (including inherited ones),
+        see `BaseStructure._reset_caches`; figured out once per-class and then remembered.
+    """
+    names = cls.__dict__.get('_cached_lazy_attr_names')
+    if names is None:
+        names = tuple({
+            name
+            for klass in cls.__mro__
+            for name, value in vars(klass).items()
+            if isinstance(value, LazyAttr)
+        })
+        cls._cached_lazy_attr_names = names
+    return names
+
+
+# Field-type to the `__dict__` of a default-constructed instance of it (or `None`),
+# see `_default_field_dict`.
+_default_field_dicts: 'weakref.WeakKeyDictionary[Type[Field], Optional[dict]]' = \
+    weakref.WeakKeyDictionary()
+
+
+def _default_field_dict(field_type: Type[Field]) -> Optional[dict]:
+    """ Returns the `__dict__` of a default-constructed `field_type` (ie: `field_type()`),
+        made once per field-type and then remembered.
+
+        `BaseStructure._generate_fields` copies it into a new `object.__new__(field_type)`
+        for every attribute that has no `Field` or value, which skips the dataclass `__init__`.
+
+        This is a shallow copy, so if `field_type` makes any mutable default values
+        (a `default_factory` or its own `__post_init__`) we return `None` instead,
+        and `field_type()` should be called as normal.
+    """
+    try:
+        return _default_field_dicts[field_type]
+    except KeyError:
+        pass
+
+    field_dict = None
+    if (
+        field_type.__post_init__ is Field.__post_init__ and
+        all(f.default_factory is dataclasses.MISSING for f in dataclasses.fields(field_type))
+    ):
+        field_dict = field_type().__dict__
+    _default_field_dicts[field_type] = field_dict
+    return field_dict
+
+
+supported_basic_types = frozenset({str, int, JsonDict, bool, float, list, dict})
 
 if TYPE_CHECKING:
     from xmodel import BaseModel
 
 
+def _unsupported_type_error(type_hint, name, model_cls, field_obj) -> XModelError:
+    # Kept out of `BaseStructure._generate_fields`, only needed when there is a problem.
+    return XModelError(
+        f"Unsupported type ({type_hint}) with field-name ({name}) "
+        f"for model-class ({model_cls}) in field-obj ({field_obj})."
+    )
+
+
 class BaseStructure(Generic[F]):
 
     """
@@ -64,7 +124,7 @@ class BaseStructure(Generic[F]):
             # This parent is my own type/class, so I am fine accessing it's private member.
             self._name_to_type_hint_map = parent._name_to_type_hint_map.copy()
 
-        self._get_fields_cache = None
+        self._reset_caches()
         self.field_type = field_type
         self.internal_shared_api_values = {}
 
@@ -103,9 +163,9 @@ class BaseStructure(Generic[F]):
         # These objects have been "moved" into me via `self.fields`.
         self._name_to_type_hint_map = type_hints
         self.model_cls = model_type
-        for field_obj in self.fields:
-            field_name = field_obj.name
-
+        self._model_cls_name = model_type.__name__
+        # Only the field names that are also set on the class need anything done to them.
+        for field_name in self._field_dict().keys() & model_type.__dict__.keys():
             # The default values are inside `field_obj.default` now.
             # We delete the class-vars, so that `__getattr__` is called when someone attempts
             # to grab a value from a BaseModel for an attribute that does not directly exist
@@ -125,8 +185,7 @@ class BaseStructure(Generic[F]):
             #    with the field-name...
             #    might be nicer, and get auto-completion that way... not sure, thinking about it.
             #
-            if field_name in self.model_cls.__dict__:
-                delattr(self.model_cls, field_name)
+            delattr(model_type, field_name)
 
     # --------------------------------------
     # --------- Environmental Properties ---------
@@ -185,6 +244,9 @@ class BaseStructure(Generic[F]):
             different then the name of the field on BaseModel the type-hint was assigned to.
     """
 
+    _model_cls_name: str = None
+    """ `BaseStructure.model_cls`'s `__name__`, set along with it; used for cache keys. """
+
     _get_fields_cache: Dict[str, F] = None
 
     @property
@@ -198,15 +260,16 @@ class BaseStructure(Generic[F]):
             return True
 
     def __copy__(self):
-        obj = type(self)(parent=self, field_type=self.field_type)
+        # Skip `__init__`, it would copy our `__dict__` and then reset most of it again.
+        obj = object.__new__(type(self))
         obj.__dict__.update(self.__dict__)
         obj._name_to_type_hint_map = self._name_to_type_hint_map.copy()
-        obj._get_fields_cache = None
+        obj._reset_caches()
         return obj
 
     def field_exists(self, name: str) -> bool:
         """ Return `True` if the field with `name` exists on the model, otherwise `False`. """
-        return name in self.field_map
+        return name in self._field_dict()
 
     def has_id_field(self):
         """ Defaults to False, returns True for RemoteStructure,
@@ -232,16 +295,17 @@ class BaseStructure(Generic[F]):
         """
         if name is None:
             return None
-        return self.field_map.get(name)
+        return self._field_dict().get(name)
 
-    @property
-    def fields(self) -> List[F]:
+    @LazyAttr
+    def fields(self) -> Sequence[F]:
         """ Returns:
-                List[xmodel.fields.Field]: list of field objects.
+                Sequence[xmodel.fields.Field]: tuple of field objects;
+                it's made once and then shared, so it's read-only.
         """
-        return list(self.field_map.values())
+        return tuple(self._field_dict().values())
 
-    @property
+    @LazyAttr
     def field_map(self) -> Mapping[str, F]:
         """
 
@@ -249,23 +313,68 @@ class BaseStructure(Generic[F]):
            Dict[str, xmodel.fields.Field]: Map of `xmodel.fields.Field.name` to
                 `xmodel.fields.Field` objects.
         """
-        cached_content = self._get_fields_cache
-        if cached_content is not None:
-            # Mapping proxy is a read-only view of the passed in dict.
-            # This will LIVE update the mapping if underlying dict changed.
-            return MappingProxyType(cached_content)
+        # Mapping proxy is a read-only view of the passed in dict.
+        # This will LIVE update the mapping if underlying dict changed,
+        # so we only need to make it once.
+        return MappingProxyType(self._field_dict())
+
+    @LazyAttr
+    def related_fields(self) -> Sequence[F]:
+        """ Returns:
+                Sequence[xmodel.fields.Field]: tuple of the fields that have a
+                `xmodel.fields.Field.related_type`, in the same order as `BaseStructure.fields`;
+                it's made once and then shared, so it's read-only.
+        """
+        return tuple(f for f in self.fields if f.related_type)
+
+    @LazyAttr
+    def fields_with_include_with(self) -> Sequence[F]:
+        """ Returns:
+                Sequence[xmodel.fields.Field]: tuple of the fields that have
+                `xmodel.fields.Field.include_with_fields` set, in the same order as
+                `BaseStructure.fields`; it's made once and then shared, so it's read-only.
+        """
+        return tuple(f for f in self.fields if f.include_with_fields)
+
+    def _reset_caches(self):
+        """ Forgets the generated fields and everything remembered about them; ie: the values
+            of all the `xmodel.common.lazy.LazyAttr`'s on us, such as `BaseStructure.fields`
+            and `BaseStructure.field_map`. They get figured out again on next access.
+
+            Anything figured out from the fields should be a `LazyAttr`, that way it's
+            automatically forgotten here.
+        """
+        self._get_fields_cache = None
+        instance_dict = self.__dict__
+        for name in _lazy_attr_names(type(self)):
+            instance_dict.pop(name, None)
+
+    def _field_dict(self) -> Dict[str, F]:
+        """ The underlying (cached) dict behind `BaseStructure.field_map`, generating it
+            if needed. Used internally for lookups so we don't have to go though the
+            read-only `MappingProxyType` each time; don't modify what it returns.
 
-        generated_fields = self._generate_fields()
-        self._get_fields_cache = generated_fields
-        return MappingProxyType(generated_fields)
+            The field names used as keys are interned by `xmodel.fields.Field.resolve_defaults`.
+        """
+        cached_content = self._get_fields_cache
+        if cached_content is None:
+            cached_content = self._generate_fields()
+            self._get_fields_cache = cached_content
+        return cached_content
 
-    def excluded_field_map(self) -> Dict[str, F]:
+    def excluded_field_map(self) -> Mapping[str, F]:
         """
         Returns:
-            Dict[str, xmodel.fields.Field]: Mapping of `xmodel.fields.Field.name` to
-                field objects that are excluded (`xmodel.fields.Field.exclude` == `True`).
+            Mapping[str, xmodel.fields.Field]: Read-only mapping of `xmodel.fields.Field.name`
+                to field objects that are excluded (`xmodel.fields.Field.exclude` == `True`).
+                It's figured out the first time it's asked for and then remembered.
         """
-        return {f.name: f for f in self.fields if f.exclude}
+        return self._excluded_field_map
+
+    @LazyAttr
+    def _excluded_field_map(self) -> Mapping[str, F]:
+        """ Storage for `BaseStructure.excluded_field_map`. """
+        return MappingProxyType({f.name: f for f in self.fields if f.exclude})
 
     def _generate_fields(self) -> Dict[str, F]:
         """ Goes though object and grabs/generated Field objects and caches them in self.
@@ -277,12 +386,13 @@ class BaseStructure(Generic[F]):
         full_field_map = {}
 
         default_field_type: Type[Field] = self.field_type
+        default_field_dict = _default_field_dict(default_field_type)
         type_hint_map = self._name_to_type_hint_map
         model_cls = self.model_cls
 
         # todo: Figure out how to put this into/consolidate into
         #  `xmodel.base.api.BaseApi`; and simplify stuff!!!
-        default_converters = getattr(self.model_cls.api, 'default_converters')
+        default_converters = model_cls.api.default_converters
 
         # todo:  default_con ^^^^ make sure we are using it!!!!
 
@@ -308,7 +418,20 @@ class BaseStructure(Generic[F]):
                 # todo: BaseModel is an abstract class... do we really need structure/fields on it?
                 continue
             # todo:  ensure we later on use these and make a new field if needed...
-            base_fields.update(base.api.structure.field_map)
+            # noinspection PyProtectedMember
+            # Parent structure is our own type, use its fields dict directly (no proxy needed).
+            base_fields.update(base.api.structure._field_dict())
+
+        # Bind these to locals, they are used for every field in the loop below.
+        _isclass = inspect.isclass
+        _Default = Default
+        _Field = Field
+        _new_object = object.__new__
+        _supported_basic_types = supported_basic_types
+        model_cls_dict = model_cls.__dict__
+
+        # Fields that have a `Field.related_field_name_for_id`, dealt with after the loop.
+        fields_with_related_id: List[Field] = []
 
         for name, type_hint in type_hint_map.items():
             # Ignore the 'api' attribute, it's special.
@@ -325,23 +448,30 @@ class BaseStructure(Generic[F]):
 
             # noinspection PyArgumentList
             field_obj: Field
-            field_value: Field = getattr(model_cls, name, Default)
-            if isinstance(field_value, Field):
+            # Almost always directly on the class (if there at all), look there first;
+            # only do the full attribute lookup (parent classes, etc.) if it's not.
+            field_value: Field = model_cls_dict.get(name, _Default)
+            if field_value is _Default:
+                field_value = getattr(model_cls, name, _Default)
+            if isinstance(field_value, _Field):
                 field_obj = field_value
-                field_value = Default
-            elif field_value is not Default:
-                if not inspect.isclass(field_value) and isinstance(field_value, property):
+                field_value = _Default
+            elif field_value is not _Default:
+                if not _isclass(field_value) and isinstance(field_value, property):
                     field_obj = default_field_type(fget=field_value.fget, fset=field_value.fset)
                 else:
                     # noinspection PyArgumentList
                     field_obj = default_field_type(default=field_value)
+            elif default_field_dict is not None:
+                # Same as `default_field_type()`, without going though its `__init__`.
+                field_obj = _new_object(default_field_type)
+                field_obj.__dict__.update(default_field_dict)
             else:
                 # noinspection PyArgumentList
                 field_obj = default_field_type()
 
             # Name can be overridden, we want to use it to lookup parent field name....
-            if field_obj.name:
-                name = field_obj.name
+            name = field_obj.name or name
 
             field_obj.resolve_defaults(
                 name=name,
@@ -353,69 +483,64 @@ class BaseStructure(Generic[F]):
             # Ensure all fields that still have `Default` as their value are resolved to None.
             field_obj.resolve_remaining_defaults_to_none()
 
+            # Tell the field what structure its `Field.related_field` lives on so it can look
+            # it up directly (`Field.model` is not always set). For to-many it's the related
+            # type's structure, otherwise it's on us. Structures are one-per-model, and getting
+            # one does not generate its fields.
+            if not field_obj.related_to_many:
+                field_obj._related_structure = self
+            elif field_obj.related_type:
+                field_obj._related_structure = field_obj.related_type.api.structure
+
             # field-object will unwrap the type-hint for us.
             type_hint = field_obj.type_hint
 
             # Name can be overridden, we want to use whatever it says we should be using.
             name = field_obj.name
-            full_field_map[field_obj.name] = field_obj
+            full_field_map[name] = field_obj
+
+            if field_obj.related_field_name_for_id:
+                fields_with_related_id.append(field_obj)
 
             # If we have a converter, we can assume that will take care of things correctly
             # for whatever type we have.  If we don't have a converter, we only support specific
             # types; We check here for type-compatibility.
-            from xmodel import BaseModel
             if (
                 not field_obj.converter and
-                type_hint not in supported_basic_types and
-                (not inspect.isclass(type_hint) or not issubclass(type_hint, BaseModel)) and
-                typing_inspect.get_origin(type_hint) not in (list, set)
+                type_hint not in _supported_basic_types and
+                (not _isclass(type_hint) or not issubclass(type_hint, BaseModel)) and
+                field_obj.type_hint_origin not in (list, set)
             ):
-                raise XModelError(
-                    f"Unsupported type ({type_hint}) with field-name ({name}) "
-                    f"for model-class ({model_cls}) in field-obj ({field_obj})."
-                )
+                raise _unsupported_type_error(type_hint, name, model_cls, field_obj)
 
-            if (
-                field_obj.json_path and
-                field_obj.json_path != field_obj.name and
-                field_obj.related_type
-            ):
-                XModelError(
-                    "Right now obj-relationships can't use the 'json_path' option "
-                    "while at the same time being obj-relationships. Must use basic field "
-                    "with api_path. "
-
-                    # Copy/Paste from `BaseApi.json`:
-                    f"Can't have xmodel.Field on BaseModel with related-type and a json_path "
-                    f"that differ at the moment, for field ({field_obj}). "
-                    f"It is something I want to support someday; the support is mostly in place "
-                    f"already, but it needs some more careful thought, attention and testing "
-                    f"before we should allow it. "
-                    "Workaround:  Make an `{field.name}_id` field next to related field on the "
-                    "model. Then, set `json_path` for that `{field.name}_id` field, set it to "
-                    "what you want it to be. Finally, set the `{related_field.name}` to "
-                    "read_only=True. This allows you to rename the `_id` field used to/from api "
-                    "in the JSON input/output, but the Model can have an alternate name for the "
-                    "related field. You can see a real-example of this at "
-                    "`bigcommerce.api.orders._BcCommonOrderMetafield.order"
-                )
+            # A related-field with a `json_path` that differs from its name is not supported
+            # yet (unless it's `read_only`, see the workaround in the error message there);
+            # that's checked and raised by `xmodel.base.api.BaseApi.json` when it's used.
 
         # todo: Provide a 'remove' option in the Field config class.
-        if 'id' not in full_field_map:
-
-            # Go though and populate the `Field.field_for_foreign_key_related_field` as needed...
-            for k, f in full_field_map.items():
-                # If there is a relate field name, and we have a field defined for it...
-                # Set it's field_for_foreign_key_related_field so the correct field...
-                # Otherwise generate a field object for this key-field.
-                #
-                # FYI: The `resolve_defaults` call above will always set
-                #      field_for_foreign_key_related_field to None.
-                #      We then set it to something here if needed.
-                if f.related_field_name_for_id:
-                    related_field = full_field_map.get(f.related_field_name_for_id)
-                    if related_field:
-                        related_field.field_for_foreign_key_related_field = f
+        link_foreign_keys = 'id' not in full_field_map
+
+        # Only the fields that have a related-field name need anything more done to them,
+        # we collected them in the loop above so we don't have to go though every field again.
+        get_field = full_field_map.get
+        for f in fields_with_related_id:
+            related_field = get_field(f.related_field_name_for_id)
+
+            # If we have a field defined for the related field name, populate
+            # its `Field.field_for_foreign_key_related_field` as needed...
+            #
+            # FYI: The `resolve_defaults` call above will always set
+            #      field_for_foreign_key_related_field to None.
+            #      We then set it to something here if needed.
+            if link_foreign_keys and related_field is not None:
+                related_field.field_for_foreign_key_related_field = f
+                related_field.is_foreign_key = True
+
+            # Any `Field.related_field` that lives on us can be resolved right now, so it
+            # never needs to be looked up later. The ones on another structure (to-many)
+            # are still resolved lazily, that structure may not have generated its fields yet.
+            if f._related_structure is self:
+                f._related_field = related_field
 
         return full_field_map
 
@@ -423,18 +548,18 @@ class BaseStructure(Generic[F]):
         """ Returns a proper key to use for `xmodel.base.client.BaseClient.cache_get`
             and other caching methods for id-based lookup of an object.
         """
-        if type(_id) is dict:
-            # todo: Put module name in this key.
-            key = f"{self.model_cls.__name__}"
-            try:
-                sorted_keys = sorted(_id.keys())
-            except TypeError:
-                sorted_keys = _id.keys()
-            for key_name in sorted_keys:
-                key += f"-{key_name}-{_id[key_name]}"
-            return key
-        else:
-            return f"{self.model_cls.__name__}-id-{_id}"
+        if type(_id) is not dict:
+            # Most common case, a single id value.
+            return f"{self._model_cls_name}-id-{_id}"
+
+        # todo: Put module name in this key.
+        try:
+            sorted_keys = sorted(_id)
+        except TypeError:
+            sorted_keys = _id
+        return '-'.join([
+            self._model_cls_name, *(f"{key_name}-{_id[key_name]}" for key_name in sorted_keys)
+        ])
 
     # todo: Get rid of this [only used by Dynamo right now]. Need to use Field instead...
     def get_unwraped_typehint(self, field_name: str):
@@ -467,19 +592,51 @@ class BaseStructure(Generic[F]):
         Returns:
             bool: `True` if this field is a child field, otherwise `False`.
         """
-        field = self.get_field(child_field_name)
-        if not field:
-            return False
-
-        related_type = field.related_type
-        if not related_type:
-            return False
-
-        related_structure = related_type.api.structure
-        if and_has_id and not related_structure.has_id_field():
+        has_id = self._child_field_has_id.get(child_field_name)
+        if has_id is None:
             return False
+        return has_id or not and_has_id
+
+    @LazyAttr
+    def _child_field_has_id(self) -> Dict[str, bool]:
+        """ Map of child field name (ie: has a `xmodel.fields.Field.related_type`) to `True`
+            if the related type's structure `BaseStructure.has_id_field`, otherwise `False`.
+            Used by `BaseStructure.is_field_a_child`; figured out the first time it's asked
+            for and then remembered.
+        """
+        return {
+            f.name: bool(f.related_type.api.structure.has_id_field())
+            for f in self.related_fields
+        }
+
+    def related_id_field_names(self) -> FrozenSet[str]:
+        """ Names of the virtual related-id attributes on the model, ie: `{field_name}_id` for
+            every field that `BaseStructure.is_field_a_child` with `and_has_id=True`.
+
+            `xmodel.base.model.BaseModel` uses this to quickly know if an attribute it's
+            getting/setting is one of these, without having to look at the fields each time.
+            Figured out the first time it's asked for and then remembered.
+        """
+        return self._related_id_field_names
+
+    @LazyAttr
+    def _related_id_field_names(self) -> FrozenSet[str]:
+        """ Storage for `BaseStructure.related_id_field_names`. """
+        return frozenset(
+            f'{name}_id' for name, has_id in self._child_field_has_id.items() if has_id
+        )
+
+    def repr_field_names(self) -> FrozenSet[str]:
+        """ Names of the fields that have `xmodel.fields.Field.include_in_repr` set,
+            used by `xmodel.base.api.BaseApi.list_of_attrs_to_repr`.
+            Figured out the first time it's asked for and then remembered.
+        """
+        return self._repr_field_names
 
-        return True
+    @LazyAttr
+    def _repr_field_names(self) -> FrozenSet[str]:
+        """ Storage for `BaseStructure.repr_field_names`. """
+        return frozenset(f.name for f in self._field_dict().values() if f.include_in_repr)
 
     @property
     def endpoint_description(self):
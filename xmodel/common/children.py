@@ -1,7 +1,7 @@
-from typing import List, Sequence, Union, Callable, Tuple, Dict, Type, Iterable
+from typing import List, Sequence, Union, Tuple, Dict, Type, Iterable
 import types
-import typing_inspect
 import inspect
+from collections import defaultdict
 from dataclasses import dataclass
 
 from xinject.context import XContext
@@ -70,40 +70,39 @@ def get_all_existent_child_objects(
         )
 
     result = []
+    append_result = result.append
     for obj in objs:
         api = obj.api
         structure = api.structure
+        get_child = api.get_child_without_lazy_lookup
+
+        # Only depends on the structure, not the field; so figure it out once per-object.
+        skip_children = need_endpoint and not structure.have_api_endpoint
 
         # todo: We are asking for related fields in a few places in this file now,
         # todo: perhaps make a method?
         # todo: We don't want to use 'obj-r', want a better way to get related fields.
         #       perhaps a list of 'xmodel.fields.Field' class objects directly from a method.
-        for field_obj in structure.fields:
+        for field_obj in structure.related_fields:
             # We want to prevent grabbing objects via API, so we check to see if it has a related
             # field id set on it.  If it does, then we continue to next field since the object
             # is not existent.
-            related_type = field_obj.related_type
-            if not related_type:
-                continue
-
             type_hint = field_obj.type_hint
             if not inspect.isclass(type_hint) or not issubclass(type_hint, BaseModel):
                 raise NotImplementedError(
                     f"Haven't implemented `List[BaseModel]` things yet; type_hint ({type_hint})..."
                 )
 
-            related_structure = api.structure
-
-            if need_endpoint and not related_structure.have_api_endpoint:
+            if skip_children:
                 # Don't have an endpoint, so skip.
                 continue
 
-            child = api.get_child_without_lazy_lookup(field_obj.name)
+            child = get_child(field_obj.name)
             if not child:
                 # If we are None/Null/False/Etc, we don't have an existent object.
                 continue
 
-            result.append(ModelChildRef(parent=obj, field=field_obj, child=child))
+            append_result(ModelChildRef(parent=obj, field=field_obj, child=child))
 
     return result
 
@@ -152,19 +151,23 @@ def bulk_request_lazy_children(objs: Union[BaseModel, Sequence[BaseModel]]):
 
     # Some internal data structure notes:
     #
-    # We have a ApiObj type key to a id int type key to a list of updating methods:
-    # ie: `updating_methods[class][int] = [updating_method_def]`
+    # We have a (ApiObj type, was-a-list) key to a id int type key to a list of updating methods:
+    # ie: `updating_methods[(class, bool)][int] = [updating_method_def]`
     #
     # This is used to gather all the primary keys, which class/endpoint they go with and
-    # finally a list of callables to call once we retrieve the object. We bulk-get by
+    # finally a list of (object, field-name) to set once we retrieve the object. We bulk-get by
     # Ctx, that way if multiple Ctx's are used for the same class, we use the correct
     # one per-object, but still in a bulk-fasion.  Normally there is only one Ctx instance
     # per-class, but I don't know if that will be the case in the future.  So I decided to not
     # assume only one and to make a general solution that should always work.
 
-    updating_method_def = Tuple[BaseModel, Callable[[BaseModel], None]]
+    # Parent object + name of the field on it to set the retrieved child object(s) on.
+    updating_method_def = Tuple[BaseModel, str]
     updating_methods_value_type = Dict[int, List[updating_method_def]]
-    updating_methods: Dict[Type[BaseModel], updating_methods_value_type] = {}
+    updating_methods_key_type = Tuple[Type[BaseModel], bool]
+    updating_methods: Dict[updating_methods_key_type, updating_methods_value_type] = defaultdict(
+        lambda: defaultdict(list)
+    )
 
     # todo: Should we recursively grab sub-sub-objects in bulk, when we need it.
     #       We should loop right here and keep a set of objects to further traverse as we
@@ -191,46 +194,24 @@ def bulk_request_lazy_children(objs: Union[BaseModel, Sequence[BaseModel]]):
         #
         # We are allowed to use any of the private methods when we do it within this file.
         #
-        for field_obj in structure.fields:
-            if not field_obj.related_type:
-                continue
-
-            related_model_class = field_obj.type_hint
+        for field_obj in structure.related_fields:
+            # Field already knows the inner model type for a `List[...]` type-hint.
+            related_model_key = (field_obj.related_type, field_obj.type_hint_origin is list)
             field_name = field_obj.name
             name_id_value = state.get_related_field_id(field_name, return_false_if_child_set=True)
             if name_id_value in (None, Null, False):
                 # No need to look further...
                 continue
 
-            dict_of_id_to_updaters = updating_methods.get(related_model_class)
-            if dict_of_id_to_updaters is None:
-                dict_of_id_to_updaters = {}
-                updating_methods[related_model_class] = dict_of_id_to_updaters
-
-            list_of_updaters = dict_of_id_to_updaters.get(name_id_value)
-            if list_of_updaters is None:
-                list_of_updaters = []
-                dict_of_id_to_updaters[name_id_value] = list_of_updaters
-
-            # Create mapping logic
-            # noinspection PyShadowingNames
-            def updater(child_obj: Union[BaseModel, list], obj=obj, field_name=field_name):
-                setattr(obj, field_name, child_obj)
-
-            # Insert mapping logic into list of callable's:
-            list_of_updaters.append((obj, updater,))
-
-    # todo: We could simplify this by directly using the `Field` objects, they already
-    #   know what the inner-model-type is [if the type-hint was a generizied `List`].
-    for model_type, id_to_updaters in updating_methods.items():
-        model_type_was_list = False
-        if typing_inspect.get_origin(model_type) is list:
-            model_type = typing_inspect.get_args(model_type)[0]
-            model_type_was_list = True
+            # Remember which object/attribute to set once we retrieve the child object(s).
+            updating_methods[related_model_key][name_id_value].append((obj, field_name))
 
+    for (model_type, model_type_was_list), id_to_updaters in updating_methods.items():
         api = model_type.api
         id_to_updaters: updating_methods_value_type
-        ctx_to_updaters: Dict[XContext, updating_methods_value_type] = {}
+        ctx_to_updaters: Dict[XContext, updating_methods_value_type] = defaultdict(
+            lambda: defaultdict(list)
+        )
 
         if model_type_was_list:
             for _id, updater_def_list in id_to_updaters.items():
@@ -246,34 +227,31 @@ def bulk_request_lazy_children(objs: Union[BaseModel, Sequence[BaseModel]]):
                 }
                 objs = api.get(query=query)
 
-                objs_mapped_to_parent_ids = {}
+                objs_mapped_to_parent_ids = defaultdict(list)
                 for obj in objs:
                     parent_id = getattr(obj, query_id_field_name, None)
                     if parent_id:
-                        objs_for_parent = objs_mapped_to_parent_ids.get(parent_id)
-                        if not objs_for_parent:
-                            objs_for_parent = []
-                        objs_for_parent.append(obj)
-                        objs_mapped_to_parent_ids[parent_id] = objs_for_parent
+                        objs_mapped_to_parent_ids[parent_id].append(obj)
+
+                # Parents without any children get a new empty list each.
+                get_child_objs = objs_mapped_to_parent_ids.get
                 for parent_id, parent_obj in parent_obj_map_by_id.items():
-                    child_objs = objs_mapped_to_parent_ids.get(parent_id, [])
-                    parent_obj[1](child_objs)
+                    setattr(parent_obj[0], parent_obj[1], get_child_objs(parent_id) or [])
         else:
-            # Separate by Ctx, that way we use correct Ctx to bulk-get sub-objects.
-            for _id, updater_def_list in id_to_updaters.items():
-                for updater_def in updater_def_list:
-                    ctx = updater_def[0].api.context
-                    new_id_to_updater_list = ctx_to_updaters.get(ctx)
-                    if new_id_to_updater_list is None:
-                        new_id_to_updater_list = {}
-                        ctx_to_updaters[ctx] = new_id_to_updater_list
-
-                    new_updaters = new_id_to_updater_list.get(_id)
-                    if new_updaters is None:
-                        new_updaters = []
-                        new_id_to_updater_list[_id] = new_updaters
-
-                    new_updaters.append(updater_def)
+            contexts = {
+                updater_def[0].api.context
+                for updater_def_list in id_to_updaters.values()
+                for updater_def in updater_def_list
+            }
+
+            if len(contexts) == 1:
+                # Normal case, everything uses the same Ctx; no need to separate anything.
+                ctx_to_updaters = {contexts.pop(): id_to_updaters}
+            else:
+                # Separate by Ctx, that way we use correct Ctx to bulk-get sub-objects.
+                for _id, updater_def_list in id_to_updaters.items():
+                    for updater_def in updater_def_list:
+                        ctx_to_updaters[updater_def[0].api.context][_id].append(updater_def)
 
             # Grab and assign the objects in their parent objects.
             for ctx, ctx_id_to_updater_def_list in ctx_to_updaters.items():
@@ -284,4 +262,4 @@ def bulk_request_lazy_children(objs: Union[BaseModel, Sequence[BaseModel]]):
                     updater_def_list = ctx_id_to_updater_def_list.get(obj.id, None)
                     if updater_def_list is not None:
                         for updater_def in updater_def_list:
-                            updater_def[1](obj)
+                            setattr(updater_def[0], updater_def[1], obj)
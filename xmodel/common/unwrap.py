@@ -1,5 +1,6 @@
-import typing_inspect
-from typing import Type, Union, Tuple
+import functools
+from types import UnionType
+from typing import Type, Union, Tuple, get_origin, get_args
 from xsentinels.null import NullType
 
 
@@ -22,10 +23,30 @@ def unwrap_optional_type(
         Tuple[Type, bool]: if `return_saw_null` is True; return Type + bool with if we saw
             `xsentinels.null.NullType` or not.
     """
-    if not typing_inspect.is_union_type(type_to_unwrap):
+    origin = get_origin(type_to_unwrap)
+    if origin is not Union and origin is not UnionType:
         return (type_to_unwrap, False) if return_saw_null else type_to_unwrap
 
-    hint_union_sub_types = typing_inspect.get_args(type_to_unwrap)
+    # Cache on the union's args, not the union its self; `Union` equality ignores the order
+    # of its args, but the order matters for what we return.
+    hint_union_sub_types = get_args(type_to_unwrap)
+    try:
+        unwrapped_type, saw_null = _unwrap_union_args(hint_union_sub_types)
+    except TypeError:
+        # An arg is not hashable (ie: has unhashable `Annotated` metadata), can't cache it.
+        unwrapped_type, saw_null = _unwrap_union_args.__wrapped__(hint_union_sub_types)
+
+    if return_saw_null:
+        return unwrapped_type, saw_null
+
+    return unwrapped_type
+
+
+@functools.lru_cache(maxsize=1024)
+def _unwrap_union_args(hint_union_sub_types: Tuple[Type, ...]) -> Tuple[Type, bool]:
+    """ Does the work for `unwrap_optional_type` with a union's args, returns a
+        `(type, saw_null)` tuple. There are only so many type-hints, so the results are cached.
+    """
     saw_null = False
     types = []
     for sub_type in hint_union_sub_types:
@@ -40,7 +61,4 @@ def unwrap_optional_type(
         # Construct final Union type with the None/Null filtered out.
         unwrapped_type = Union[tuple(types)]
 
-    if return_saw_null:
-        return unwrapped_type, saw_null
-
-    return unwrapped_type
+    return unwrapped_type, saw_null
@@ -40,9 +40,10 @@ class SetUnsetValues:
         if not parent:
             return
 
-        for name, value in parent.__dict__.items():
-            if name not in self.__dict__:
-                setattr(self, name, copy(value))
+        parent_values = parent.__dict__
+        # Only the names we have not directly set on self yet.
+        for name in parent_values.keys() - self.__dict__.keys():
+            setattr(self, name, copy(parent_values[name]))
 
 
 def chunk_list(list: List[Any], chunk_size: int) -> List[List[Any]]:
@@ -10,7 +10,7 @@ from xmodel.errors import XModelError
 from decimal import Decimal
 from xbool import bool_value
 
-_to_obj_directions = {Converter.Direction.from_json, Converter.Direction.to_model}
+_to_obj_directions = frozenset({Converter.Direction.from_json, Converter.Direction.to_model})
 Direction = Converter.Direction
 
 T = TypeVar("T")
@@ -48,14 +48,24 @@ def convert_json_int(
 class EnumConverter(Converter):
     def from_json(self, api: 'BaseApi', field: 'Field', value: Any):
         # todo: lists of enums, someday...
-        if value in (Null, None):
+        if value is None or value is Null:
             return value
-        if isinstance(value, field.type_hint):
+        enum_type = field.type_hint
+        if isinstance(value, enum_type):
             return value
-        return field.type_hint(value)
+        # Look the member up directly by value first, calling the enum type is much slower.
+        # noinspection PyProtectedMember
+        try:
+            member = enum_type._value2member_map_.get(value)
+        except TypeError:
+            # Unhashable value, let the enum type figure it out.
+            member = None
+        if member is not None:
+            return member
+        return enum_type(value)
 
     def to_json(self, api: 'BaseApi', field: 'Field', value: Any):
-        if value in (Null, None):
+        if value is None or value is Null:
             return value
         return value.value
 
@@ -111,11 +121,14 @@ class ConvertBasicType(Converter, Generic[T]):
             field: Field,
             value: Union[dt.date, str, None]
     ) -> T:
-        if value in (None, Null) and direction == Direction.from_json and field.nullable:
-            return Null
+        # Most common case, value is already the correct type; nothing to convert.
+        if type(value) is self.basic_type:
+            return value
 
-        if value is None:
-            return None
+        if value is None or value is Null:
+            if direction is Direction.from_json and field.nullable:
+                return Null
+            return value
 
         if isinstance(value, list):
             return [self.convert_basic_value(x) for x in value]
@@ -123,9 +136,21 @@ class ConvertBasicType(Converter, Generic[T]):
         return self.convert_basic_value(value)
 
 
+_str_bool_values = {
+    'y': True, 'yes': True, 't': True, 'true': True, 'on': True, '1': True,
+    'n': False, 'no': False, 'f': False, 'false': False, 'off': False, '0': False,
+}
+""" The strings `xbool.bool_value` understands (after strip/lower); looked up directly first
+    by `ConvertBasicBool`, anything else still goes though `xbool.bool_value`.
+"""
+
+
 class ConvertBasicBool(ConvertBasicType[bool]):
     def convert_basic_value(self, value) -> T:
         if isinstance(value, str):
+            result = _str_bool_values.get(value.strip().lower())
+            if result is not None:
+                return result
             return bool_value(value)
         return super().convert_basic_value(value)
 
@@ -154,13 +179,21 @@ def convert_json_date(
     """ Default converter method used for converting date to/from json.
         See `xmodel.fields.Converter` for more details.
     """
-    if value in (None, Null) and direction == Direction.from_json and field.nullable:
+    if (value is None or value is Null) and direction is Direction.from_json and field.nullable:
         return Null
 
     if value is None or value is Null:
         return value
 
     if direction in _to_obj_directions:
+        # `fromisoformat` is much faster than `strptime`, but on newer Python versions it also
+        # accepts other ISO formats (ie: '20210304' or '2021-W09-4'); so only use it for the
+        # normal zero-padded 'YYYY-MM-DD' format, `strptime` decides on everything else.
+        if len(value) == 10 and value[4] == '-' and value[7] == '-':
+            try:
+                return dt.date.fromisoformat(value)
+            except ValueError:
+                pass
         return dt.datetime.strptime(value, '%Y-%m-%d').date()
 
     if isinstance(value, dt.datetime):
@@ -179,7 +212,7 @@ def convert_json_datetime(
     """ Default converter method used for converting datetime to/from json.
         See `xmodel.fields.Converter` for more details.
     """
-    if value in (None, Null) and direction == Direction.from_json and field.nullable:
+    if (value is None or value is Null) and direction is Direction.from_json and field.nullable:
         return Null
 
     if value is None or value is Null:
@@ -227,11 +260,11 @@ def convert_decimal(
     if direction is Direction.to_json:
         if isinstance(value, Decimal):
             # Prevents using exponents, ie: '1.234E-5'
-            return "{0:f}".format(value)
+            return format(value, 'f')
         # If we don't have a decimal, try our best to get string value.
         return str(value)
 
-    if direction not in (Direction.to_model, Direction.from_json):
+    if direction not in _to_obj_directions:
         # We don't know the direction (new direct?)
         raise XModelError(
             f"Unknown direction ({direction}), can't convert value ({value}); "
@@ -240,6 +273,10 @@ def convert_decimal(
 
     # Going into model, return a Decimal.
     # Decimal class
+    if type(value) is Decimal:
+        # Already a Decimal (they are immutable), no need to make a new one.
+        return value
+
     if isinstance(value, float):
         # If we don't convert to string first, we could end up with an
         # undesirable binaryFloat --> Decimal conversion.
@@ -262,7 +299,7 @@ def convert_uuid(
         # Convert UUID object into a str.
         return str(value)
 
-    if direction not in (Direction.to_model, Direction.from_json):
+    if direction not in _to_obj_directions:
         # We don't know the direction (new direct?)
         raise XModelError(
             f"Unknown direction ({direction}), can't convert value ({value}); "
@@ -1,13 +1,14 @@
 import dataclasses
+from collections import defaultdict
+from itertools import chain
 from uuid import UUID
 from decimal import Decimal
 from logging import getLogger
 from typing import (
-    TypeVar, Type, get_type_hints, Union, List, Dict, Iterable, Set, Optional, Generic, Mapping,
+    TypeVar, Type, Union, List, Dict, Iterable, Optional, Generic, Mapping,
     Any
 )
 
-import typing_inspect
 
 from xinject import Dependency
 from xsentinels import Default
@@ -84,7 +85,7 @@ class RemoteApi(BaseApi[M]):
         if client:
             return client
 
-        client_type = get_type_hints(type(self)).get('client', None)
+        client_type = self.resolved_type_hints().get('client', None)
         if client_type is None:
             raise XModelError(
                 f"RemoteClient subclass type is undefined for model class ({self.model_type}), "
@@ -123,7 +124,8 @@ class RemoteApi(BaseApi[M]):
         You can also discover if an attempt to send it was even made, and so on.
         """
         response_state = self._response_state
-        if not response_state:
+        if response_state is None:
+            # Made lazily, most model objects never need one.
             self._generate_state_if_needed()
             response_state = self._response_state
         return response_state
@@ -283,14 +285,7 @@ class RemoteApi(BaseApi[M]):
                 f"in order to currently be used in `get_via_id` method at the moment."
             )
 
-        result_is_list = False
-
-        if typing_inspect.is_union_type(field_type):
-            raise XModelError(
-                f"Field `{id_field}` for model type {self.model_type} can't be a union-type"
-                f"({field_type}), it needs to be a specific type like `int`, `str`, etc."
-            )
-
+        # FYI: A union-type is never `int`/`str`, so it's already rejected by the check above.
         result_is_list = value_type not in (int, str, dict)
 
         # ^^^ NEW END ^^^
@@ -304,11 +299,24 @@ class RemoteApi(BaseApi[M]):
         #   consider making a separate method for most of the rest of the method
         #   and doing this in this one, followed by calling the new one [when returning list].
         key_dicts = []
+        # Used to skip any duplicate id/keys we were given, no need to look for them twice.
+        seen_keys = set()
         for key_values in loop(id):
             if isinstance(key_values, dict):
-                key_dicts.append(key_values)
+                key_dict = key_values
             else:
-                key_dicts.append({id_field: key_values})
+                key_dict = {id_field: key_values}
+
+            try:
+                seen_key = frozenset(key_dict.items())
+            except TypeError:
+                # Has an unhashable value, so we can't easily tell if it's a duplicate.
+                key_dicts.append(key_dict)
+                continue
+
+            if seen_key not in seen_keys:
+                seen_keys.add(seen_key)
+                key_dicts.append(key_dict)
 
         if not result_is_list:
             if not disable_all_caching:
@@ -339,25 +347,35 @@ class RemoteApi(BaseApi[M]):
 
         # Check weak cache for objs and remove them by index
         indexes_to_remove_in_key_dicts = set()
-        cached_results = set()
-        for index, key_dict in enumerate(key_dicts):
-            if disable_all_caching:
-                # We are not doing any cache lookups for now, this may change in the future
-                # as we make this more sophisticated.
-                continue
+        # Used as an ordered-set, objects found in a cache in the order we found them.
+        cached_results = {}
+        if disable_all_caching:
+            # We are not doing any cache lookups for now, this may change in the future
+            # as we make this more sophisticated.
+            cache_keys = weak_cached_objs = ()
+        else:
+            # Look them all up at once.
+            cache_keys = [structure.id_cache_key(key_dict) for key_dict in key_dicts]
+            weak_cached_objs = client.cache_weak_get_many(cache_keys)
 
-            cached_obj = client.cache_weak_get(structure.id_cache_key(key_dict))
+        for index, (key_dict, cache_key, cached_obj) in enumerate(
+                zip(key_dicts, cache_keys, weak_cached_objs)
+        ):
             if cached_obj:
-                cached_results.add(cached_obj)
+                cached_results[cached_obj] = None
                 indexes_to_remove_in_key_dicts.add(index)
+                # Already have it, no need to look for it in the other cache.
+                continue
             if len(key_dict.keys()) == 1:
                 # We want to check if there is only one key in key dict and then check if that
                 # key is "id"
                 obj_id: Union[list, int, str] = key_dict.get("id")
                 if obj_id and type(obj_id) is int:
-                    cached_obj = client.cache_get(structure.id_cache_key(obj_id))
+                    # The key-dict only has the 'id' in it, so its cache-key is the same
+                    # one we would get for the `obj_id` by its self.
+                    cached_obj = client.cache_get(cache_key)
                     if cached_obj:
-                        cached_results.add(cached_obj)
+                        cached_results[cached_obj] = None
                         indexes_to_remove_in_key_dicts.add(index)
                 elif obj_id and type(obj_id) is str:
                     #   I think we can assume people using our method will NOT pass in comma
@@ -370,34 +388,33 @@ class RemoteApi(BaseApi[M]):
 
                     # If obj_id is a str then there is the possibility that there were multiple
                     # ids in that string separated by a comma
-                    obj_id_set: Union[Set[str], str] = set(obj_id.split(","))
-                    if len(obj_id) > 0:
-                        for _id in obj_id_set:
-                            _id = _id.strip()
-                            cached_obj = client.cache_get(structure.id_cache_key(_id))
-                            if cached_obj:
-                                cached_results.add(cached_obj)
-                                obj_id_set.remove(_id)
-                        if len(obj_id_set) > 0:
-                            obj_ids = ""
-                            for _id in obj_id_set:
-                                obj_ids += _id + ","
-                            obj_ids = obj_ids[:-1]
-                            key_dict["id"] = obj_ids
+                    # (de-duplicated, keeping their order).
+                    obj_id_parts = list(dict.fromkeys(
+                        _id for _id in (part.strip() for part in obj_id.split(",")) if _id
+                    ))
+                    cached_objs = client.cache_get_many(
+                        [structure.id_cache_key(_id) for _id in obj_id_parts]
+                    )
+                    remaining_ids = []
+                    for _id, cached_obj in zip(obj_id_parts, cached_objs):
+                        if cached_obj:
+                            cached_results[cached_obj] = None
                         else:
-                            indexes_to_remove_in_key_dicts.add(index)
+                            remaining_ids.append(_id)
+
+                    if remaining_ids:
+                        key_dict["id"] = ",".join(remaining_ids)
                     else:
-                        cached_obj = client.cache_get(structure.id_cache_key(obj_id))
-                        if cached_obj:
-                            cached_results.add(cached_obj)
-                            indexes_to_remove_in_key_dicts.add(index)
+                        indexes_to_remove_in_key_dicts.add(index)
 
-        for index in sorted(indexes_to_remove_in_key_dicts, reverse=True):
-            del key_dicts[index]
+        if indexes_to_remove_in_key_dicts:
+            key_dicts = [
+                key_dict for index, key_dict in enumerate(key_dicts)
+                if index not in indexes_to_remove_in_key_dicts
+            ]
 
         # Add objects found in cache to results
-        for cached_obj in cached_results:
-            results.append(cached_obj)
+        results.extend(cached_results)
 
         # Check the rest of the objects in key_dicts after removing the ones found in the cache
         for obj in key_dicts:
@@ -408,22 +425,28 @@ class RemoteApi(BaseApi[M]):
 
         if id_cache_is_enabled:
             # If caching enabled, go though each id and check for cached version.
-            indexes_to_remove = []
-            for index, obj_with_id in enumerate(objs_with_id_field):
-                # More Info: See previous comment for ctx.cache_get, just above ^ [in this method].
-                #
-                # But to summarize:
-                # When this/these object(s) are updated via update_from_json, the cache will be set
-                # automatically if the sub-class has the cache_by_id ApiOption set to True.
-                obj = client.cache_get(structure.id_cache_key(obj_with_id.get(id_field)))
+            indexes_to_remove = set()
+            # More Info: See previous comment for ctx.cache_get, just above ^ [in this method].
+            #
+            # But to summarize:
+            # When this/these object(s) are updated via update_from_json, the cache will be set
+            # automatically if the sub-class has the cache_by_id ApiOption set to True.
+            cached_objs = client.cache_get_many([
+                structure.id_cache_key(obj_with_id.get(id_field))
+                for obj_with_id in objs_with_id_field
+            ])
+            for index, obj in enumerate(cached_objs):
                 if obj is not None:
                     results.append(obj)
-                    indexes_to_remove.append(index)
+                    indexes_to_remove.add(index)
                     continue
 
             # Remove any objects that were found in cache.
-            for index in sorted(indexes_to_remove, reverse=True):
-                del objs_with_id_field[index]
+            if indexes_to_remove:
+                objs_with_id_field = [
+                    obj_with_id for index, obj_with_id in enumerate(objs_with_id_field)
+                    if index not in indexes_to_remove
+                ]
 
         log.info(
             f"Getting ({len(objs_with_id_field) + len(objs_with_no_id_field)}) objects via "
@@ -432,43 +455,32 @@ class RemoteApi(BaseApi[M]):
 
         # Combine keys-groups that use the same combination of keys, we can get
         # them in one query....
-        query_groups = {}
-        for obj in loop(objs_with_id_field, objs_with_no_id_field):
-            obj_keys = frozenset(obj.keys())
-            obj_group = query_groups.setdefault(obj_keys, [])
-            obj_group.append(obj)
+        # (both are plain lists of key-dicts, so we can just chain them together).
+        query_groups = defaultdict(list)
+        query_results = []
+        for obj in chain(objs_with_id_field, objs_with_no_id_field):
+            query_groups[frozenset(obj)].append(obj)
 
-        results = []
-        for key in query_groups:
-            obj_group = query_groups[key]
-            query = {}
-            items_in_query_fields_count = 0
-            while len(obj_group) > 0:
-                obj = obj_group.pop()
-                obj_keys = obj.keys()
-                if items_in_query_fields_count + len(obj_keys) > max_query_by_id:
-                    obj_group.append(obj)
-                    items_in_query_fields_count = max_query_by_id + 1
-                else:
-                    for obj_key in obj_keys:
-                        query_field_group = query.setdefault(obj_key, [])
-                        query_field_group.append(obj.get(obj_key))
-                        items_in_query_fields_count += 1
-
-                if (
-                    items_in_query_fields_count >= max_query_by_id or
-                    len(obj_group) == 0
-                ):
-                    # Apply any extra query user provided.
-                    if aux_query:
-                        query.update(aux_query)
-
-                    # Execute query and append results.
-                    results.append(self.get(query, fields=fields))
-                    query = {}
-                    items_in_query_fields_count = 0
-
-        return loop(*results)
+        for obj_group in query_groups.values():
+            # Every key-dict in a group has the same keys, so we know up-front how many of them
+            # fit into a query [always at least one per-query].
+            group_keys = list(obj_group[0])
+            objs_per_query = max(1, max_query_by_id // (len(group_keys) or 1))
+
+            for start in range(0, len(obj_group), objs_per_query):
+                query_objs = obj_group[start:start + objs_per_query]
+                query = {key: [obj[key] for obj in query_objs] for key in group_keys}
+
+                # Apply any extra query user provided.
+                if aux_query:
+                    query.update(aux_query)
+
+                # Execute query and append results.
+                query_results.append(self.get(query, fields=fields))
+
+        # `results` only has the individual cached objects in it, and each query gave us its own
+        # iterable of objects (or None); chain them all together without copying them.
+        return chain(results, chain.from_iterable(r for r in query_results if r is not None))
 
     def get(
             self,
@@ -578,7 +590,8 @@ class RemoteApi(BaseApi[M]):
             if id_value:
                 self.client.cache_weak_set(structure.id_cache_key(id_value), model)
 
-            if self.option_for_name('cache_by_id'):
+            # Only look up the option if there is something we could do with it.
+            if (id_value or model.id) and self.option_for_name('cache_by_id'):
                 if id_value is None and model.id:
                     self.client.cache_remove(structure.id_cache_key(model.id))
                 elif id_value:
@@ -651,8 +664,31 @@ class RemoteApi(BaseApi[M]):
 
             See `BaseApi.option_all_for_name` for more details.
         """
-        values = self.option_all_for_name(option_attribute_name=option_attribute_name)
-        return values[0] if values else None
+        # Same order as `option_all_for_name`, but we can stop at the first one we find.
+        for options in self._options_to_check():
+            # Explicitly set values are in the instance dict, read them straight from there.
+            options_dict = options.__dict__
+            if option_attribute_name in options_dict:
+                return options_dict[option_attribute_name]
+
+        return getattr(self.options, option_attribute_name, None)
+
+    def _options_to_check(self) -> List[ApiOptions]:
+        """ The options objects to look at (in priority order) for
+            `RemoteApi.option_all_for_name` and `RemoteApi.option_for_name`.
+        """
+        # This gets the the context, and all parent context's options in order.
+        context_option_list = self.context.dependency_chain(ApiOptionsGroup)
+
+        options_to_check = []
+        for option_group in context_option_list:
+            # Only grather options that have been previously created.
+            options = option_group.get(api=self, create_if_needed=False)
+            if options:
+                options_to_check.append(options)
+
+        options_to_check.append(self.structure.api_options)
+        return options_to_check
 
     def option_all_for_name(self, option_attribute_name) -> List[Any]:
         """
@@ -673,18 +709,7 @@ class RemoteApi(BaseApi[M]):
         """
 
         values = []
-        # This gets the the context, and all parent context's options in order.
-        context_option_list = self.context.dependency_chain(ApiOptionsGroup)
-
-        options_to_check = []
-        structure = self.structure
-        for option_group in context_option_list:
-            # Only grather options that have been previously created.
-            options = option_group.get(api=self, create_if_needed=False)
-            if options:
-                options_to_check.append(options)
-
-        options_to_check.append(structure.api_options)
+        options_to_check = self._options_to_check()
 
         # If the option has been explicitly set on object, it's the first one.
         #
@@ -694,8 +719,9 @@ class RemoteApi(BaseApi[M]):
         #       Update (2021-03-26): Yes, want to change this; Look at `Field` class for better
         #       example of how to inhert values from parents.
         for options in options_to_check:
-            if option_attribute_name in options.__dict__:
-                values.append(getattr(options, option_attribute_name, None))
+            options_dict = options.__dict__
+            if option_attribute_name in options_dict:
+                values.append(options_dict[option_attribute_name])
 
         # todo: Add values from options in parent context(s) somehow.
         #       Comments in our doc-comment [above].
@@ -718,6 +744,6 @@ class RemoteApi(BaseApi[M]):
     _client_type: Type[RemoteClient] = None
 
     def _generate_state_if_needed(self):
-        if not self._response_state:
+        if self._response_state is None:
             self._response_state = ResponseState()
 
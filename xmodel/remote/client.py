@@ -12,7 +12,7 @@ from .model import RemoteModel
 # types.  I put more stuff from typing that is not strictly needed here; that way those modules
 # will get these basic types just as easily.
 from typing import (
-    TypeVar, Dict, Any, Optional, Iterable, Generic, Sequence, TYPE_CHECKING
+    TypeVar, Dict, Any, Optional, Iterable, Generic, Sequence, List, TYPE_CHECKING
 )
 
 if TYPE_CHECKING:
@@ -35,6 +35,12 @@ class _ClientCacheDependency(Dependency):
     obj_cache: Dict[str, Any] = None
     obj_weak_cache: weakref.WeakValueDictionary = None
 
+    obj_cache_max_size: Optional[int] = None
+    """ If not `None`, the most objects we will strongly keep in `obj_cache`;
+        the ones that were set the longest time ago are forgotten first.
+        By default there is no limit.
+    """
+
 
 class RemoteClient(Generic[M]):
     api: "RemoteApi[M]"
@@ -60,6 +66,8 @@ class RemoteClient(Generic[M]):
         """
         super().__init__()
         self._api = api
+        # We only ever belong to one model type, and the cache methods use it a lot.
+        self._model_type = api.model_type
 
     @property
     def api(self) -> "RemoteApi[M]":
@@ -128,10 +136,10 @@ class RemoteClient(Generic[M]):
             A good way to get a key-by-id is via
             `xmodel.remote.structure.RemoteStructure.id_cache_key`.
         """
-        return WeakCachePool.grab().get(self.api.model_type, key, default)
+        return WeakCachePool.grab().get(self._model_type, key, default)
 
     def cache_weak_remove(self, key):
-        WeakCachePool.grab().remove(self.api.model_type, key)
+        WeakCachePool.grab().remove(self._model_type, key)
 
     def cache_set(self, key, value):
         """ Right now this is a dictionary that you can set/retrieve keys from.
@@ -143,7 +151,18 @@ class RemoteClient(Generic[M]):
             A good way to get a key-by-id is via
             `xmodel.remote.structure.RemoteStructure.id_cache_key`.
          """
-        _ClientCacheDependency.grab().obj_cache[key] = value
+        cache_dependency = _ClientCacheDependency.grab()
+        obj_cache = cache_dependency.obj_cache
+        max_size = cache_dependency.obj_cache_max_size
+        if max_size is None:
+            obj_cache[key] = value
+            return
+
+        # Re-setting a key makes it the newest one (dict keeps insertion order).
+        obj_cache.pop(key, None)
+        obj_cache[key] = value
+        while len(obj_cache) > max_size:
+            del obj_cache[next(iter(obj_cache))]
 
     def cache_get(self, key, default=None):
         """ See cache_set documentation above for more details.
@@ -157,6 +176,32 @@ class RemoteClient(Generic[M]):
             return weak_obj
         return _ClientCacheDependency.grab().obj_cache.get(key, default)
 
+    def cache_weak_get_many(self, keys: Iterable[str], default=None) -> List:
+        """ Same as `RemoteClient.cache_weak_get`, but for several keys at once.
+
+            Returns a list with the value for each key, in the same order as the keys
+            (`default` for any key that is not in the weak cache).
+
+            By default, this calls `RemoteClient.cache_weak_get` for each key; so overriding
+            that is enough to customize both. A subclass can override this too if it has a
+            quicker way to look up several keys at once.
+        """
+        cache_weak_get = self.cache_weak_get
+        return [cache_weak_get(key, default) for key in keys]
+
+    def cache_get_many(self, keys: Iterable[str], default=None) -> List:
+        """ Same as `RemoteClient.cache_get`, but for several keys at once.
+
+            Returns a list with the value for each key, in the same order as the keys
+            (`default` for any key that is not in the cache).
+
+            By default, this calls `RemoteClient.cache_get` for each key; so overriding
+            that is enough to customize both. A subclass can override this too if it has a
+            quicker way to look up several keys at once.
+        """
+        cache_get = self.cache_get
+        return [cache_get(key, default) for key in keys]
+
     def cache_remove(self, key):
         """ See cache_set documentation above for more details.
             This gets removes something out of the cache if it exists, or does nothing otherwise.
@@ -46,21 +46,28 @@ class RemoteModel(BaseModel, lazy_loader=_lazy_load_types):
             self.id = id
 
     def __repr__(self):
-        message = super().__repr__().split("(")[1][:-1]
-
-        response_state = self.api.response_state
-        response_state_attrs = []
-
-        if response_state.had_error is not None:
-            response_state_attrs.append('had_error')
-
-        if response_state.response_code is not None and response_state.response_code != 200:
-            response_state_attrs.append('response_code')
-
-        if response_state.errors is not None:
-            response_state_attrs.append('errors')
-
-        for attr in response_state_attrs:
-            message += f', __{attr}={getattr(response_state, attr, None)}'
-
-        return f"{self.__class__.__name__}({message})"
+        cls_name = self.__class__.__name__
+        # Take what's inside the parenthesis; a value could have its own parenthesis in it
+        # (ie: a child model's repr), so we don't split on them.
+        parts = [super().__repr__()[len(cls_name) + 1:-1]]
+
+        # Only look at the state if one was made, no need to make one just for a repr
+        # (it would have nothing interesting in it).
+        # noinspection PyProtectedMember
+        response_state = self.api._response_state
+        if response_state is None:
+            return f"{cls_name}({parts[0]})"
+
+        had_error = response_state.had_error
+        if had_error is not None:
+            parts.append(f'__had_error={had_error}')
+
+        response_code = response_state.response_code
+        if response_code is not None and response_code != 200:
+            parts.append(f'__response_code={response_code}')
+
+        errors = response_state.errors
+        if errors is not None:
+            parts.append(f'__errors={errors}')
+
+        return f"{cls_name}({', '.join(parts)})"
@@ -53,6 +53,13 @@ class ApiOptions(Generic[T], SetUnsetValues):
         if cache_by_id is not None:
             self.cache_by_id = cache_by_id
 
+    def __copy__(self):
+        # Only the explicitly set values are in our `__dict__`, a shallow copy of that is all
+        # we need (and quicker than the general `copy.copy` reduce based approach).
+        obj = object.__new__(type(self))
+        obj.__dict__.update(self.__dict__)
+        return obj
+
     def __repr__(self):
         return (
             'ApiOptions('
@@ -70,14 +77,16 @@ class ApiOptionsGroup(Dependency):
         self._api_structure_to_options_map = {}
 
     def get(self, *, api: 'RemoteApi', create_if_needed=True) -> ApiOptions:
-        options = self._api_structure_to_options_map.get(api.model_type)
-        if options:
+        options_map = self._api_structure_to_options_map
+        model_type = api.model_type
+        options = options_map.get(model_type)
+        if options is not None:
             return options
 
         if not create_if_needed:
             return None
 
         options = ApiOptions()
-        self._api_structure_to_options_map[api.model_type] = options
+        options_map[model_type] = options
         return options
 
@@ -200,6 +200,10 @@ class ResponseState(Generic[T]):
             - `False` (default): Nothing more happens.
             - `True`: We will NOT reset the self.try_count, it will be left as-is.
         """
+        if not self.__dict__:
+            # Nothing was ever set on us, so everything is still the class's default value
+            # (ie: None or Zero); no need to set them all again.
+            return
 
         # _self Helps PyCharm go to the class-level attribute when jumping to it's declaration.
         # Otherwise it will come here instead of where the attributes doc-comment is.
@@ -271,11 +275,12 @@ class ResponseState(Generic[T]):
 
         error_list = field_errors.setdefault(field, [])
 
-        # construct final message structure:
-        message = {
-            **(other or {}),
-            "code": code
-        }
+        # construct final message structure (a copy of `other`, we don't modify what's passed in):
+        if other:
+            message = dict(other)
+            message["code"] = code
+        else:
+            message = {"code": code}
 
         # Append message to error list.
         error_list.append(message)
@@ -106,6 +106,7 @@ class WeakCachePool(Dependency):
         self.clear_caches()
 
     _enabled = None
+    # Value-type to a weak-value dict of key to value.
     _obj_weak_cache: Dict[Type, weakref.WeakValueDictionary] = None
 
     def __init__(self, enable=False):
@@ -113,8 +114,10 @@ class WeakCachePool(Dependency):
         self.clear_caches()
 
     def clear_caches(self):
-
-        self._obj_weak_cache = dict()
+        # If nothing was ever cached (ie: pool entered/exited without being used) there is
+        # nothing to clear; keep using the same empty dict.
+        if self._obj_weak_cache is None or self._obj_weak_cache:
+            self._obj_weak_cache = dict()
 
     def set(self, key: str, value):
         """
@@ -136,15 +139,16 @@ class WeakCachePool(Dependency):
 
         See `xmodel.base.client.BaseClient.cache_weak_get` for more details.
         """
-        if not self.enabled:
+        if not self._enabled:
             return
 
         # Check to see if we have weak-dict for the value-type...
         value_type = type(value)
-        if value_type not in self._obj_weak_cache:
-            self._obj_weak_cache[value_type] = weakref.WeakValueDictionary()
+        type_weak_dict = self._obj_weak_cache.get(value_type, None)
+        if type_weak_dict is None:
+            type_weak_dict = self._obj_weak_cache[value_type] = weakref.WeakValueDictionary()
 
-        self._obj_weak_cache[value_type][key] = value
+        type_weak_dict[key] = value
 
     def get(self, value_type: Type, key: str, default=None):
         """
@@ -164,7 +168,7 @@ class WeakCachePool(Dependency):
         A good way to get a key-by-id is via
         `xmodel.base.structure.BaseStructure.id_cache_key`.
         """
-        if not self.enabled:
+        if not self._enabled:
             return None
 
         type_weak_dict = self._obj_weak_cache.get(value_type, None)
@@ -175,7 +179,7 @@ class WeakCachePool(Dependency):
 
     def remove(self, value_type: Type, key: str):
         # No need to check if not enabled (optimization).
-        if not self.enabled:
+        if not self._enabled:
             return
 
         type_weak_dict = self._obj_weak_cache.get(value_type, None)
@@ -3,6 +3,17 @@ from xloop import xloop, DEFAULT_NOT_ITERATE
 
 T = TypeVar("T")
 
+_not_iterate = (*DEFAULT_NOT_ITERATE, dict)
+
 
 def loop(*args: Union[Iterable[T], T]) -> Iterator[T]:
-    return xloop(*args, not_iterate=[*DEFAULT_NOT_ITERATE, dict])
+    if len(args) == 1:
+        # Most common case, a single list/tuple (or None); xloop would just iterate it and skip
+        # any `None` values in it, so we can do that directly.
+        arg = args[0]
+        arg_type = type(arg)
+        if arg_type is list or arg_type is tuple:
+            return (v for v in arg if v is not None)
+        if arg is None:
+            return iter(())
+    return xloop(*args, not_iterate=_not_iterate)